@@ -4,6 +4,7 @@ Configurazione per MicroNav Raspberry Pi
 Contiene tutte le impostazioni per MQTT, display, WiFi e sistema
 """
 
+import ast
 import os
 import time
 from dotenv import load_dotenv
@@ -103,6 +104,16 @@ DISPLAY_CONFIG = {
     'spi_device': 0,        # SPI device 0 (CE0)
     'spi_speed': 40000000,  # 40MHz (velocità SPI)
     'spi_mode': 0,          # Modalità SPI
+    # Byte per singola scrittura spidev. Per inviare un frame intero (320x240x2 = 153600 byte, RGB565)
+    # in una sola scrittura aggiungere 'spidev.bufsiz=262144' a /boot/firmware/cmdline.txt:
+    # il valore effettivo viene limitato a /sys/module/spidev/parameters/bufsiz
+    'spi_transfer_size': 262144,
+    'gpio_chip': 0,         # gpiochip usato da lgpio per il backlight (/dev/gpiochip0)
+    # Thread di rendering su una CPU dedicata con priorità real-time (serve root o CAP_SYS_NICE).
+    # Per isolare la CPU dal resto del sistema aggiungere 'isolcpus=3 nohz_full=3'
+    # a /boot/firmware/cmdline.txt. None disattiva la relativa impostazione.
+    'render_cpu': 3,
+    'render_rt_priority': 20,
     'bgr': True,            # BGR=True per ST7789V3 (formato colore)
     'invert': False,        # Non invertire colori
     'h_offset': 0,          # Offset orizzontale
@@ -177,6 +188,9 @@ BOOT_IMAGE_CONFIG = {
 DIRECTIONS_ICONS_CONFIG = {
     'path': BASE_PATH + '/micronav-assets/directions-icons/src/png/light',
     'size': 128,
+    # Filtro di ridimensionamento (nome di PIL.Image.Resampling): su icone piatte
+    # BILINEAR è indistinguibile da LANCZOS e molto più economico sul Pi
+    'resample': 'BILINEAR',
     'icon_traffic_light': BASE_PATH + '/micronav-assets/speedcams/traffic-light.png'
 }
 
@@ -187,6 +201,7 @@ GPS_CONFIG = {
     'baudrate': 9600,              # Velocità trasmissione
     'timeout': 1.0,                # Timeout lettura (secondi)
     'fix_timeout': 45,             # Timeout per ottenere fix (secondi)
+    'epoch_gap': 0.1,              # Silenzio sulla linea che chiude un burst NMEA (secondi)
     'update_rate': 1,              # Frequenza aggiornamento (Hz)
     'enable_sbas': True,           # Abilita SBAS
     'min_satellites': 4,           # Numero minimo satelliti per fix
@@ -309,6 +324,31 @@ def get_logging_config() -> Dict[str, Any]:
     return LOGGING_CONFIG.copy()
 
 
+# Sezioni rileggibili a caldo da reload_from_disk (aggiornate in place)
+RELOADABLE_SECTIONS = ('COLORS', 'FONT_CONFIG')
+
+def reload_from_disk() -> None:
+    """
+    Rilegge da questo file solo le sezioni in RELOADABLE_SECTIONS.
+    
+    A differenza di importlib.reload non riesegue il modulo (niente .env, topic MQTT, ecc.):
+    valuta soltanto le assegnazioni interessate e aggiorna in place i dizionari esistenti.
+    """
+    with open(__file__, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=__file__)
+    
+    namespace = {'BASE_PATH': BASE_PATH}
+    for node in tree.body:
+        if not (isinstance(node, ast.Assign) and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name)
+                and node.targets[0].id in RELOADABLE_SECTIONS):
+            continue
+        value = eval(compile(ast.Expression(node.value), __file__, 'eval'), namespace)
+        section = globals()[node.targets[0].id]
+        section.clear()
+        section.update(value)
+
+
 def get_timestamp_ms() -> int:
     """
     Restituisce un timestamp Unix in millisecondi (13 cifre).
@@ -7,15 +7,27 @@ Gestisce il display TFT ST7789 1.47" per visualizzare istruzioni di navigazione
 import time
 import logging
 import threading
-import importlib
+import queue
+import os
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
-from PIL import Image, ImageDraw, ImageFont
+import numpy as np
+import PIL
+from PIL import Image, ImageChops, ImageColor, ImageDraw, ImageFont
 import RPi.GPIO as GPIO
 
+try:
+    import lgpio  # Accesso diretto a /dev/gpiochip (consigliato su Pi 5)
+except ImportError:
+    lgpio = None
+
 try:
     from luma.core.interface.serial import spi
-    from luma.core.render import canvas
+    from luma.core.framebuffer import full_frame
     from luma.lcd.device import st7789
     from luma.core.interface.parallel import bitbang_6800
 except ImportError:
@@ -28,16 +40,138 @@ from logging_config import get_logger
 # Inizializza logging
 logger = get_logger(__name__)
 
+# Costanti GPIO risolte una sola volta (evita lookup di attributi del modulo ad ogni chiamata)
+_GPIO_OUT = GPIO.OUT
+_GPIO_HIGH = GPIO.HIGH
+_GPIO_LOW = GPIO.LOW
+
+
+@lru_cache(maxsize=2048)
+def _fmt_distance(meters) -> str:
+    """Formatta una distanza in metri come '850m' o '1.3km'"""
+    if meters < 1000:
+        return f"{meters}m"
+    return f"{meters / 1000:.1f}km"
+
+
+@lru_cache(maxsize=2048)
+def _fmt_duration(seconds) -> str:
+    """Formatta una durata in secondi come '45s', '12m' o '2h 5m'"""
+    if seconds < 60:
+        return f"{seconds}s"
+    hours, rest = divmod(seconds, 3600)
+    if not hours:
+        return f"{rest // 60}m"
+    return f"{hours}h {rest // 60}m"
+
+
+def _normalize_colors(colors: Dict[str, Any]) -> Dict[str, Tuple[int, ...]]:
+    """Risolve una sola volta i colori espressi come stringa ('#rrggbb', nomi) in tuple RGB"""
+    return {
+        name: ImageColor.getrgb(value) if isinstance(value, str) else tuple(value)
+        for name, value in colors.items()
+    }
+
+
+@lru_cache(maxsize=32)
+def _open_truetype(font_path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Apre un font TrueType; i ricaricamenti con stesso path e dimensione riusano l'istanza"""
+    return ImageFont.truetype(font_path, size)
+
+
+class _LgpioPWM:
+    """PWM del backlight tramite lgpio, con la stessa interfaccia di RPi.GPIO.PWM"""
+    
+    def __init__(self, handle: int, pin: int, frequency: int):
+        self.handle = handle
+        self.pin = pin
+        self.frequency = frequency
+    
+    def start(self, duty_cycle: float):
+        lgpio.tx_pwm(self.handle, self.pin, self.frequency, duty_cycle)
+    
+    def ChangeDutyCycle(self, duty_cycle: float):
+        lgpio.tx_pwm(self.handle, self.pin, self.frequency, duty_cycle)
+    
+    def stop(self):
+        lgpio.tx_pwm(self.handle, self.pin, 0, 0)
+
+
+class _LgpioGPIO:
+    """Pin GPIO tramite lgpio (/dev/gpiochip), con l'interfaccia di RPi.GPIO usata anche da luma"""
+    
+    BCM = GPIO.BCM
+    OUT = _GPIO_OUT
+    IN = GPIO.IN
+    HIGH = _GPIO_HIGH
+    LOW = _GPIO_LOW
+    
+    def __init__(self, handle: int):
+        self.handle = handle
+    
+    def setmode(self, mode):
+        pass  # lgpio usa sempre la numerazione BCM
+    
+    def setwarnings(self, flag):
+        pass
+    
+    def setup(self, pin: int, direction, initial=None, **kwargs):
+        if direction == self.OUT:
+            lgpio.gpio_claim_output(self.handle, pin, 1 if initial else 0)
+        else:
+            lgpio.gpio_claim_input(self.handle, pin)
+    
+    def output(self, pin: int, value):
+        lgpio.gpio_write(self.handle, pin, 1 if value else 0)
+    
+    def input(self, pin: int) -> int:
+        return lgpio.gpio_read(self.handle, pin)
+    
+    def PWM(self, pin: int, frequency: int) -> _LgpioPWM:
+        return _LgpioPWM(self.handle, pin, frequency)
+    
+    def cleanup(self, *args):
+        """Rilascia il gpiochip (una sola volta)"""
+        if self.handle is not None:
+            lgpio.gpiochip_close(self.handle)
+            self.handle = None
+
+
 class MicroNavDisplayController:
     """Controller per display TFT ST7789 MicroNav"""
     
+    # Altezza (righe) delle fasce in cui viene suddivisa la ricerca delle zone modificate
+    _DIRTY_BAND_HEIGHT = 16
+    
+    # Posizione degli indicatori di connessione nella barra di stato
+    _INDICATOR_X = {'wifi': 10, 'mqtt': 65, 'gps': 120}
+    _INDICATOR_Y = 35
+    
+    # Indicatori di connessione: tipo -> (etichetta, {stato: (colore pallino, colore testo)})
+    _INDICATOR_STATES = {
+        'wifi': ("WiFi", {True: ('green', 'white'), False: ('gray', 'gray')}),
+        'mqtt': ("MQTT", {True: ('green', 'white'), False: ('gray', 'gray')}),
+        'gps': ("GPS", {
+            'fix': ('green', 'white'),
+            'nofix': ('yellow', 'light_gray'),
+            'off': ('gray', 'gray'),
+        }),
+    }
+    # Stato indicatore GPS per (connesso, fix)
+    _GPS_STATE = {
+        (True, True): 'fix',
+        (True, False): 'nofix',
+        (False, True): 'off',
+        (False, False): 'off',
+    }
+    
     def __init__(self):
         """Inizializza il controller display"""
         self.device = None
         self.is_initialized = False
         self.current_instruction = None
         self.current_route = None
-        self.current_speedcam = None  # Dati speedcam corrente
+        self._current_speedcam = None  # Dati speedcam corrente (vedi proprietà current_speedcam)
         self.current_speedcam_distance = None  # Distanza speedcam corrente
         self.current_connection_status = {  # Stato connessioni (overlay)
             'wifi_connected': False,
@@ -45,12 +179,37 @@ class MicroNavDisplayController:
             'gps_connected': False,
             'gps_has_fix': False
         }
+        # Ultimo stato connessioni ricevuto (wifi, mqtt, gps, fix) per saltare gli aggiornamenti identici
+        self._last_conn_state = None
         self.display_thread = None
+        self.tx_thread = None
         self.running = False
         
+        # Backend GPIO: _LgpioGPIO se lgpio è disponibile, altrimenti il modulo RPi.GPIO
+        self._gpio = GPIO
+        self._gpio_configured = False
+        
+        # PWM del backlight (creato alla prima impostazione della luminosità)
+        self.backlight_pwm = None
+        # Ultimo livello scritto sul pin del backlight (evita scritture ripetute)
+        self._bl_state = False
+        
         # Buffer per aggiornamenti parziali
         self.current_display_image = None
         
+        # Doppio buffer: le schermate disegnano sul back buffer, il front buffer è l'ultimo frame completo
+        self._front_buffer = None
+        self._back_buffer = None
+        self._draw_front = None
+        self._draw_back = None
+        # Ultimo frame trasmesso al pannello (coordinate dispositivo), base per il diff
+        self._panel_image = None
+        # Finestra CASET/RASET attualmente impostata sul controller
+        self._panel_window = None
+        # Buffer RGB565 preallocato per l'invio dei pixel (e la sua vista a byte)
+        self._pixel_buf = None
+        self._pixel_bytes = None
+        
         # Configurazione
         self._load_config()
 
@@ -77,11 +236,53 @@ class MicroNavDisplayController:
             'last_update': None
         }
         
-        # Cache immagini
+        # Cache immagini: path icona -> RGB ridimensionata e già composta sul nero, None se mancante;
+        # (path, dimensione) -> RGB per logo e icone speedcam caricate con _load_image
         self.icon_cache = {}
+        # Path icona risolti: (icon, type, modifier) -> path
+        self._icon_path_cache = {}
+        # Esistenza dei file icona non gestiti da icon_cache: path -> bool
+        self._icon_exists_cache = {}
+        # Decodifiche in corso avviate al boot: path icona -> Future
+        self._icon_prewarm_futures = {}
         
-        # Lock per proteggere accessi concorrenti al display
-        self.display_lock = threading.Lock()
+        # Cache larghezze testo: (id(font), testo) -> pixel (svuotata ad ogni caricamento font)
+        self._text_w_cache: Dict[Tuple[int, str], float] = {}
+        # Cache bounding box testo: (id(font), testo) -> (left, top, right, bottom)
+        self._text_bbox_cache: Dict[Tuple[int, str], Tuple[int, int, int, int]] = {}
+        # Cache testo a capo: (id(font), testo, larghezza) -> (righe unite da '\n', spaziatura)
+        self._wrap_cache: Dict[Tuple[int, str, int], Tuple[str, int]] = {}
+        # Cache etichette rasterizzate: (id(font), testo, colore) -> (RGB, maschera)
+        self._label_cache: Dict[Tuple[int, str, Any], Tuple[Image.Image, Image.Image]] = {}
+        
+        # Parti statiche pre-rasterizzate (ricostruite ad ogni caricamento font)
+        self._idle_bg = None
+        self._route_chrome = None
+        self._fallback_icon = None
+        self._indicator_sprites = None
+        # Barre di stato composte: (wifi, mqtt, stato gps) -> (RGB, maschera alpha)
+        self._status_strip_cache = {}
+        
+        # Lock dei buffer di disegno: lo prendono solo il thread di rendering e i frame speciali,
+        # mai i produttori (show_*, update_connections_status) che aggiornano solo lo stato
+        # (rientrante: l'invio sincrono di fallback può avvenire dentro un blocco già protetto)
+        self.display_lock = threading.RLock()
+        
+        # Coda di rendering: maxsize=1 coalesce le richieste ravvicinate in un solo frame
+        self._render_queue = queue.Queue(maxsize=1)
+        # Coda di trasmissione: un solo frame in attesa di SPI, quelli superati vengono scartati
+        self._tx_queue = queue.Queue(maxsize=1)
+        # Serializza le trasmissioni SPI (thread di trasmissione e frame speciali sincroni)
+        self._tx_lock = threading.Lock()
+        # Serializza le scritture backlight/PWM (stop() può sovrapporsi a set_brightness da
+        # un altro thread); le scritture sul pin prendono anche _tx_lock perché il thread di
+        # trasmissione pilota il DC sullo stesso backend _gpio. Ordine: _backlight_lock -> _tx_lock
+        self._backlight_lock = threading.RLock()
+        # Stato cambiato dall'ultimo frame disegnato (la schermata va ridisegnata)
+        self._state_dirty = False
+        # Campi disegnati dell'ultima istruzione/panoramica mostrata (per saltare i frame identici)
+        self._last_nav_key = None
+        self._last_route_key = None
         
         logger.debug("Display Controller MicroNav inizializzato")
     
@@ -89,26 +290,33 @@ class MicroNavDisplayController:
         """Carica la configurazione dal modulo config"""
         self.config = config.get_display_config()
         self.gpio_config = config.get_gpio_config()
-        self.colors = config.get_colors_config()
+        self.colors = _normalize_colors(config.get_colors_config())
         self.font_config = config.get_font_config()
         self.boot_image_config = config.get_boot_image_config()
         self.directions_icons_config = config.get_directions_icons_config()
+        # Filtro di ridimensionamento delle icone, risolto una sola volta
+        self._icon_resample = getattr(
+            Image.Resampling,
+            self.directions_icons_config.get('resample', 'BILINEAR'),
+            Image.Resampling.BILINEAR
+        )
     
     def reload_config_and_fonts(self):
         """Ricarica la configurazione e i font con le nuove dimensioni"""
         try:
             logger.debug("🔄 Ricaricamento configurazione e font...")
             
-            # Ricarica il modulo config
-            importlib.reload(config)
-            logger.debug("✅ Modulo config ricaricato")
-            
-            # Ricarica la configurazione
-            self._load_config()
+            # Rilegge solo colori e font, fuori dal lock del display
+            config.reload_from_disk()
+            colors = _normalize_colors(config.get_colors_config())
+            font_config = config.get_font_config()
             logger.debug("✅ Configurazione ricaricata")
             
-            # Ricarica i font con le nuove dimensioni
-            self._load_fonts()
+            # Sostituzione sotto lock: nessun frame viene disegnato con colori e font misti
+            with self.display_lock:
+                self.colors = colors
+                self.font_config = font_config
+                self._load_fonts()
             logger.info("✅ Font ricaricati con nuove dimensioni")
             
             return True
@@ -120,18 +328,14 @@ class MicroNavDisplayController:
     def initialize_display(self) -> bool:
         """Inizializza il display TFT ST7789"""
         logger.debug("🔧 Inizializzazione display ST7789...")
+        # Pillow-SIMD (drop-in per PIL, versioni "*.postN") accelera i resize con NEON su ARM
+        pil_build = "SIMD" if ".post" in PIL.__version__ else "standard"
+        logger.debug(f"🖼️ Pillow {PIL.__version__} ({pil_build})")
         
         try:
-            # Configura GPIO
+            # Configura GPIO e pin display
             logger.debug("📌 Configurazione GPIO...")
-            GPIO.setmode(GPIO.BCM)
-            GPIO.setwarnings(False)
-            
-            # Configura pin display
-            GPIO.setup(self.gpio_config['TFT_CS'], GPIO.OUT)
-            GPIO.setup(self.gpio_config['TFT_DC'], GPIO.OUT)
-            GPIO.setup(self.gpio_config['TFT_RST'], GPIO.OUT)
-            GPIO.setup(self.gpio_config['TFT_BL'], GPIO.OUT)
+            self._ensure_gpio_configured()
             logger.debug("✅ GPIO configurato")
             
             # Abilita backlight PRIMA di tutto e mantienilo acceso
@@ -140,28 +344,27 @@ class MicroNavDisplayController:
             
             # Reset display
             logger.debug("🔄 Reset display...")
-            GPIO.output(self.gpio_config['TFT_RST'], GPIO.LOW)
+            self._gpio.output(self.gpio_config['TFT_RST'], _GPIO_LOW)
             time.sleep(0.1)
-            GPIO.output(self.gpio_config['TFT_RST'], GPIO.HIGH)
+            self._gpio.output(self.gpio_config['TFT_RST'], _GPIO_HIGH)
             time.sleep(0.1)
             logger.debug("✅ Reset completato")
             
-            # Verifica backlight dopo reset
-            self._ensure_backlight_on()
-            
             # Configura interfaccia SPI
             logger.debug("🔌 Configurazione SPI...")
+            transfer_size = self._get_spi_transfer_size()
+            # Stesso backend GPIO anche per i toggle di DC/RST fatti da luma durante le scritture SPI
             serial = spi(
-                port=0,
-                device=0,
+                gpio=self._gpio,
+                port=self.config.get('spi_port', 0),
+                device=self.config.get('spi_device', 0),
+                bus_speed_hz=self.config.get('spi_speed', 8000000),
+                transfer_size=transfer_size,
                 gpio_DC=self.gpio_config['TFT_DC'],
                 gpio_RST=self.gpio_config['TFT_RST'],
                 gpio_CS=self.gpio_config['TFT_CS']
             )
-            logger.debug("✅ SPI configurato")
-            
-            # Verifica backlight dopo SPI
-            self._ensure_backlight_on()
+            logger.debug(f"✅ SPI configurato ({self.config.get('spi_speed', 8000000) // 1000000}MHz, blocchi da {transfer_size} byte)")
             
             # Crea dispositivo ST7789
             logger.debug("🖥️ Creazione dispositivo ST7789...")
@@ -170,18 +373,35 @@ class MicroNavDisplayController:
             logger.debug(f"   BGR: {self.config.get('bgr', False)}")
             logger.debug(f"   Invert: {self.config.get('invert', False)}")
             
+            # Il diff rispetto al frame precedente è gestito da _flush_framebuffer:
+            # luma deve sempre inviare il frame completo per non basarsi su uno stato obsoleto
             self.device = st7789(
                 serial,
                 width=self.config['width'],
                 height=self.config['height'],
                 rotate=self.config['rotate'],
                 bgr=self.config.get('bgr', False),
-                invert=self.config.get('invert', False)
+                invert=self.config.get('invert', False),
+                framebuffer=full_frame()
             )
+            
+            # COLMOD 16 bit/pixel (RGB565): i frame vengono impacchettati da _write_region
+            self.device.command(0x3A, 0x55)
             logger.debug("✅ Dispositivo ST7789 creato")
             
-            # Verifica backlight dopo creazione dispositivo
-            self._ensure_backlight_on()
+            # Doppio buffer per le schermate, allocato una sola volta
+            size = (self.config['width'], self.config['height'])
+            self._front_buffer = Image.new('RGB', size, self.colors['black'])
+            self._back_buffer = Image.new('RGB', size, self.colors['black'])
+            self._draw_front = ImageDraw.Draw(self._front_buffer)
+            self._draw_back = ImageDraw.Draw(self._back_buffer)
+            self._panel_image = None
+            self._panel_window = None
+            self._last_conn_state = None
+            
+            # Buffer RGB565 per l'invio SPI, riusato ad ogni frame (stesso numero di pixel in ogni rotazione)
+            self._pixel_buf = np.empty(size[0] * size[1], dtype='>u2')
+            self._pixel_bytes = self._pixel_buf.view(np.uint8)
             
             # Carica font
             logger.debug("🔤 Caricamento font...")
@@ -191,9 +411,6 @@ class MicroNavDisplayController:
             logger.info("🧪 Boot display...")
             self._boot_display()
             
-            # Verifica backlight dopo test
-            self._ensure_backlight_on()
-            
             # Imposta brightness dalla configurazione (crea PWM se necessario)
             initial_brightness = self.config.get('brightness', 30)
             self.set_brightness(initial_brightness)
@@ -207,13 +424,16 @@ class MicroNavDisplayController:
                 try:
                     # Crea un'immagine nera temporanea per forzare il refresh
                     test_image = Image.new('RGB', (self.config['width'], self.config['height']), color='black')
-                    self.device.display(test_image)
+                    self._flush_framebuffer(test_image)
                     logger.debug("🔄 Display refresh forzato dopo inizializzazione")
                 except Exception as e:
                     logger.warning(f"⚠️ Errore refresh display: {e}")
             
             self.is_initialized = True
             logger.debug("✅ Display TFT ST7789 inizializzato con successo")
+            
+            # Decodifica le icone di manovra in background: la prima istruzione non attende il disco
+            self._prewarm_icons()
             return True
             
         except Exception as e:
@@ -222,8 +442,41 @@ class MicroNavDisplayController:
             # Mantieni backlight acceso durante i tentativi alternativi
             self._ensure_backlight_on()
     
+    def _get_spi_transfer_size(self) -> int:
+        """
+        Determina la dimensione massima di una singola scrittura SPI
+        
+        spidev rifiuta scritture più grandi del suo buffer (bufsiz, 4096 byte di default),
+        quindi il valore configurato viene limitato a quello del modulo kernel.
+        
+        Returns:
+            int: Byte per scrittura spidev
+        """
+        requested = self.config.get('spi_transfer_size', 4096)
+        frame_size = self.config['width'] * self.config['height'] * 2  # RGB565
+        
+        try:
+            with open('/sys/module/spidev/parameters/bufsiz') as f:
+                bufsiz = int(f.read().strip())
+        except (OSError, ValueError):
+            logger.debug("bufsiz spidev non leggibile, uso il valore configurato")
+            return requested
+        
+        if bufsiz < frame_size:
+            logger.warning(f"⚠️ spidev.bufsiz={bufsiz} < frame ({frame_size} byte): il frame verrà inviato in "
+                           f"{-(-frame_size // min(requested, bufsiz))} blocchi. "
+                           f"Aggiungi 'spidev.bufsiz=262144' a /boot/firmware/cmdline.txt")
+        
+        return min(requested, bufsiz)
+    
     def _load_fonts(self):
         """Carica i font per il display"""
+        # Le larghezze memorizzate sono legate alle istanze dei font precedenti
+        self._text_w_cache.clear()
+        self._text_bbox_cache.clear()
+        self._wrap_cache.clear()
+        self._label_cache.clear()
+        
         try:
             # Font LCD per fonts_sm
             lcd_fonts = self.font_config['lcd_fonts']
@@ -239,9 +492,9 @@ class MicroNavDisplayController:
             fonts_sm_loaded = False
             for font_path in lcd_paths:
                 try:
-                    self.fonts_sm['small'] = ImageFont.truetype(font_path, lcd_sizes['small'])
-                    self.fonts_sm['medium'] = ImageFont.truetype(font_path, lcd_sizes['medium'])
-                    self.fonts_sm['large'] = ImageFont.truetype(font_path, lcd_sizes['large'])
+                    self.fonts_sm['small'] = _open_truetype(font_path, lcd_sizes['small'])
+                    self.fonts_sm['medium'] = _open_truetype(font_path, lcd_sizes['medium'])
+                    self.fonts_sm['large'] = _open_truetype(font_path, lcd_sizes['large'])
                     logger.debug(f"Font LCD caricati da: {font_path}")
                     fonts_sm_loaded = True
                     break
@@ -253,9 +506,9 @@ class MicroNavDisplayController:
             fonts_sys_loaded = False
             for font_path in system_paths:
                 try:
-                    self.fonts_sys['small'] = ImageFont.truetype(font_path, system_sizes['small'])
-                    self.fonts_sys['medium'] = ImageFont.truetype(font_path, system_sizes['medium'])
-                    self.fonts_sys['large'] = ImageFont.truetype(font_path, system_sizes['large'])
+                    self.fonts_sys['small'] = _open_truetype(font_path, system_sizes['small'])
+                    self.fonts_sys['medium'] = _open_truetype(font_path, system_sizes['medium'])
+                    self.fonts_sys['large'] = _open_truetype(font_path, system_sizes['large'])
                     logger.debug(f"Font di sistema caricati da: {font_path}")
                     fonts_sys_loaded = True
                     break
@@ -293,6 +546,12 @@ class MicroNavDisplayController:
                 'medium': ImageFont.load_default(),
                 'large': ImageFont.load_default(),
             }
+        
+        # Ricostruisce le parti statiche con i nuovi font
+        try:
+            self._prebuild_static_assets()
+        except Exception as e:
+            logger.error(f"Errore pre-rasterizzazione elementi statici: {e}")
     
     def _boot_display(self):
         """Test del display con pattern colorato"""
@@ -301,7 +560,6 @@ class MicroNavDisplayController:
             boot_image_path = self.boot_image_config['path']
             boot_image_time = self.boot_image_config['time']
             try:
-                import os
                 if os.path.exists(boot_image_path):
                     logger.debug(f"Caricamento immagine: {boot_image_path}")
                     
@@ -310,17 +568,13 @@ class MicroNavDisplayController:
                         logger.debug(f"Immagine caricata: {boot_image.mode} {boot_image.size}")
                         
                         # Mostra l'immagine direttamente sul display
-                        self.device.display(boot_image)
+                        self._flush_framebuffer(boot_image.convert('RGB'))
                         logger.debug("✅ Immagine di boot mostrata correttamente")
                 else:
                     logger.warning(f"File immagine di boot non trovato: {boot_image_path}")
                     # Fallback con canvas e testo
-                    with canvas(self.device) as draw:
-                        # Sfondo completamente bianco per test visibilità
-                        draw.rectangle(
-                            (0, 0, self.config['width'], self.config['height']),
-                            fill=self.colors['white']
-                        )
+                    # Sfondo completamente bianco per test visibilità
+                    with self._frame(background='white') as draw:
                         draw.text(
                             (self.config['width']//2 - 50, self.config['height']//2 - 20),
                             "MicroNav",
@@ -331,12 +585,8 @@ class MicroNavDisplayController:
             except Exception as e:
                 logger.error(f"Errore caricamento immagine di boot: {e}")
                 # Fallback con canvas e testo
-                with canvas(self.device) as draw:
-                    # Sfondo completamente bianco per test visibilità
-                    draw.rectangle(
-                        (0, 0, self.config['width'], self.config['height']),
-                        fill=self.colors['white']
-                    )
+                # Sfondo completamente bianco per test visibilità
+                with self._frame(background='white') as draw:
                     draw.text(
                         (self.config['width']//2 - 50, self.config['height']//2 - 20),
                         "MicroNav",
@@ -357,82 +607,43 @@ class MicroNavDisplayController:
             return
         
         try:
-            # Verifica che GPIO sia configurato
-            if not hasattr(GPIO, '_mode'):
-                logger.debug("GPIO non configurato, riconfigurazione...")
-                GPIO.setmode(GPIO.BCM)
-                GPIO.setwarnings(False)
-            
-            # Verifica che i pin siano configurati come OUTPUT
-            try:
-                # Prova a usare un pin per vedere se è configurato
-                GPIO.output(self.gpio_config['TFT_BL'], GPIO.HIGH)
-            except RuntimeError as e:
-                if "not been set up as an OUTPUT" in str(e):
-                    logger.debug("Pin GPIO non configurati, riconfigurazione...")
-                    # Riconfigura tutti i pin
-                    GPIO.setup(self.gpio_config['TFT_CS'], GPIO.OUT)
-                    GPIO.setup(self.gpio_config['TFT_DC'], GPIO.OUT)
-                    GPIO.setup(self.gpio_config['TFT_RST'], GPIO.OUT)
-                    GPIO.setup(self.gpio_config['TFT_BL'], GPIO.OUT)
-                    logger.debug("✅ Pin GPIO riconfigurati")
-                else:
-                    raise e
-            
-            with canvas(self.device) as draw:
-                draw.rectangle(
-                    (0, 0, self.config['width'], self.config['height']),
-                    fill=self.colors['black']
-                )
+            with self._frame(background='black'):
+                pass  # Il back buffer viene già riempito di nero
             
             # Non resettare il buffer quando si pulisce lo schermo
             # self.current_display_image = None
             
         except Exception as e:
             logger.error(f"Errore pulizia display: {e}")
-            # Se c'è un errore, prova a riconfigurare GPIO
-            try:
-                GPIO.setmode(GPIO.BCM)
-                GPIO.setwarnings(False)
-                GPIO.setup(self.gpio_config['TFT_CS'], GPIO.OUT)
-                GPIO.setup(self.gpio_config['TFT_DC'], GPIO.OUT)
-                GPIO.setup(self.gpio_config['TFT_RST'], GPIO.OUT)
-                GPIO.setup(self.gpio_config['TFT_BL'], GPIO.OUT)
-                logger.debug("GPIO completamente riconfigurato per clear_display")
-            except Exception as gpio_error:
-                logger.error(f"Errore riconfigurazione GPIO: {gpio_error}")
             
     def reset_display(self):
         """Reset completo del display in caso di problemi gravi"""
         try:
             logger.warning("🔄 Reset completo del display")
             
+            # Recupero GPIO: riconfigura backend e pin anche se già configurati
+            try:
+                self._ensure_gpio_configured(force=True)
+                with self._backlight_lock:
+                    if self.backlight_pwm is not None:
+                        with self._tx_lock:
+                            self.backlight_pwm.ChangeDutyCycle(self.display_state['brightness'])
+                    else:
+                        self._ensure_backlight_on()
+                logger.debug("✅ GPIO riconfigurato")
+            except Exception as gpio_error:
+                logger.error(f"Errore riconfigurazione GPIO: {gpio_error}")
+            
             # Pulisci il display
             self.clear_display()
             time.sleep(0.5)
             
             # Mostra schermata di reset
-            with canvas(self.device) as draw:
-                # Sfondo rosso per indicare reset
-                draw.rectangle(
-                    (0, 0, self.config['width'], self.config['height']),
-                    fill=self.colors['red']
-                )
-                
+            # Sfondo rosso per indicare reset
+            with self._frame(background='red') as draw:
                 # Testo reset
-                draw.text(
-                    (10, 50),
-                    "RESET",
-                    font=self.fonts_sm['large'],
-                    fill=self.colors['white']
-                )
-                
-                draw.text(
-                    (10, 100),
-                    "Display",
-                    font=self.fonts_sm['medium'],
-                    fill=self.colors['white']
-                )
+                self._draw_label(draw, (10, 50), "RESET", self.fonts_sm['large'], self.colors['white'])
+                self._draw_label(draw, (10, 100), "Display", self.fonts_sm['medium'], self.colors['white'])
             
             time.sleep(2)
             
@@ -449,48 +660,71 @@ class MicroNavDisplayController:
             except:
                 pass
     
+    def _prebuild_static_assets(self):
+        """
+        Pre-rasterizza le parti statiche delle schermate (sfondo idle, etichette panoramica)
+        
+        Va richiamato dopo ogni caricamento dei font: le schermate incollano queste immagini
+        invece di decodificare il logo e rasterizzare le etichette ad ogni frame.
+        """
+        size = (self.config['width'], self.config['height'])
+        
+        # Sfondo idle: logo (o titolo) + testo di stato
+        idle_bg = Image.new('RGB', size, self.colors['black'])
+        draw = ImageDraw.Draw(idle_bg)
+        logo_path = '/home/micronav/micronav-pi/micronav-assets/micronav.png'
+        
+        # Il logo resta in cache: ai ricaricamenti dei font non viene ridecodificato
+        logo_image = self._load_image(logo_path) if self._icon_exists(logo_path) else None
+        if logo_image is not None:
+            idle_bg.paste(logo_image, (0, 0))
+        else:
+            # Logo/titolo
+            draw.text(
+                (self.config['width'] // 2 - 80, 90),
+                "MicroNav",
+                font=self.fonts_sys['large'],
+                fill=self.colors['white']
+            )
+        
+        # Status
+        status_text = "attesa percorso..."
+        text_width = self._tw(self.fonts_sys['small'], status_text)
+        text_x = int(self.config['width'] - text_width) // 2
+        
+        draw.text(
+            (text_x, 140),
+            status_text,
+            font=self.fonts_sys['small'],
+            fill=self.colors['gray']
+        )
+        self._idle_bg = idle_bg
+        
+        # Cornice panoramica percorso: sfondo + titolo + etichette "Da:"/"A:"
+        route_chrome = Image.new('RGB', size, self.colors['black'])
+        draw = ImageDraw.Draw(route_chrome)
+        draw.text((10, 15), "Percorso", font=self.fonts_sm['large'], fill=self.colors['white'])
+        draw.text((10, 45), "Da:", font=self.fonts_sys['medium'], fill=self.colors['light_gray'])
+        draw.text((10, 100), "A:", font=self.fonts_sys['medium'], fill=self.colors['light_gray'])
+        self._route_chrome = route_chrome
+        
+        # Icona di fallback (riquadro con "?") su sfondo nero, come le icone di manovra
+        fallback = Image.new('RGB', (21, 21), self.colors['black'])
+        draw = ImageDraw.Draw(fallback)
+        draw.rectangle((0, 0, 20, 20), outline=self.colors['white'], width=2)
+        draw.text((5, 5), "?", font=self.fonts_sm['small'], fill=self.colors['white'])
+        self._fallback_icon = fallback
+        
+        # Sprite degli indicatori di connessione (dipendono dal font)
+        self._build_indicator_sprites()
+    
     def _draw_idle_content(self, draw):
         """Disegna il contenuto della schermata idle"""
         try:
-            import os
-            logo_path = '/home/micronav/micronav-pi/micronav-assets/micronav.png'
-            
-            # Sfondo nero
-            draw.rectangle(
-                (0, 0, self.config['width'], self.config['height']),
-                fill=self.colors['black']
-            )
-
-            if os.path.exists(logo_path):
-                logger.debug(f"Caricamento immagine: {logo_path}")
-                
-                # Carica l'immagine
-                with Image.open(logo_path) as logo_image:
-                    draw._image.paste(logo_image, (0, 0))
-            else:
-                 
-                # Logo/titolo
-                draw.text(
-                    (self.config['width'] // 2 - 80, 90),
-                    "MicroNav",
-                    font=self.fonts_sys['large'],
-                    fill=self.colors['white']
-                )
-                
+            if self._idle_bg is None:
+                self._prebuild_static_assets()
             
-            # Status
-            status_text = "attesa percorso..."
-            # Calcola larghezza testo usando textbbox per compatibilità
-            bbox = draw.textbbox((0, 0), status_text, font=self.fonts_sys['small'])
-            text_width = bbox[2] - bbox[0]
-            text_x = (self.config['width'] - text_width) // 2
-            
-            draw.text(
-                (text_x, 140),
-                status_text,
-                font=self.fonts_sys['small'],
-                fill=self.colors['gray']
-            )
+            draw._image.paste(self._idle_bg, (0, 0))
             
         except Exception as e:
             logger.error(f"Errore disegno contenuto idle: {e}")
@@ -501,44 +735,18 @@ class MicroNavDisplayController:
             logger.warning("Display non inizializzato, impossibile mostrare schermata idle")
             return
         
-        try:
-            with self.display_lock:
-                logger.debug("Mostrando schermata idle")
-                
-                # Aggiorna lo stato PRIMA di disegnare per evitare conflitti
-                self.display_state['current_screen'] = 'idle'
-                self.display_state['last_update'] = datetime.now()
-                
-                with canvas(self.device) as draw:
-                    self._draw_idle_content(draw)
-                    
-                    # Disegna overlay speedcam se presente e permesso (non cambia current_screen)
-                    if (self.current_speedcam and self.current_speedcam_distance is not None and 
-                        self._should_show_speedcam_overlay()):
-                        self._draw_speedcam_alert_content(draw, self.current_speedcam, self.current_speedcam_distance)
-                    
-                    # Disegna sempre gli indicatori di connessione (overlay)
-                    status = self.current_connection_status
-                    self._draw_wifi_indicator(draw, status.get('wifi_connected', False))
-                    self._draw_mqtt_indicator(draw, status.get('mqtt_connected', False))
-                    self._draw_gps_indicator(draw, status.get('gps_connected', False), status.get('gps_has_fix', False))
-                
-                # Salva l'immagine corrente per aggiornamenti parziali
-                # Per la schermata idle non è critico, ma manteniamo coerenza
-                self._save_current_display()
-                
-                logger.debug("Schermata idle visualizzata correttamente")
-                
-        except Exception as e:
-            logger.error(f"Errore schermata idle: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.debug("Mostrando schermata idle")
+        
+        # Aggiorna lo stato: il disegno avviene nel thread di rendering
+        self.display_state['current_screen'] = 'idle'
+        self.display_state['last_update'] = datetime.now()
+        self._request_render()
 
 
 
 ### Schermate di navigazione
 
-    def _draw_navigation_content(self, draw, instruction_data: Dict[str, Any] = None, safe_mode: bool = False):
+    def _draw_navigation_content(self, draw, instruction_data: Dict[str, Any] = None):
         """Disegna il contenuto della schermata di navigazione"""
         try:
             # Usa i dati correnti se non forniti
@@ -551,11 +759,8 @@ class MicroNavDisplayController:
             maneuver = instruction_data.get('maneuver', {})
             icon = instruction_data.get('icon', '')
             
-            # Sfondo
-            draw.rectangle(
-                (0, 0, self.config['width'], self.config['height']),
-                fill=self.colors['black']
-            )
+            # Sfondo: riempimento diretto del buffer, senza rasterizzare un rettangolo
+            draw._image.paste(self.colors['black'], (0, 0, self.config['width'], self.config['height']))
             
             # Icona manovra (se disponibile)
             if maneuver:
@@ -578,9 +783,7 @@ class MicroNavDisplayController:
             
             # Distanza
             if distance > 0:
-                distance_text = f"{distance}m"
-                if distance >= 1000:
-                    distance_text = f"{distance/1000:.1f}km"
+                distance_text = _fmt_distance(distance)
                 
                 draw.text(
                     (10, 160),
@@ -588,11 +791,6 @@ class MicroNavDisplayController:
                     font=self.fonts_sys['large'],
                     fill=self.colors['white']
                 )
-
-            # Salva l'immagine corrente per aggiornamenti parziali (solo se non in modalità safe)
-            if not safe_mode:
-                self._save_current_display()
-
             
         except Exception as e:
             logger.error(f"Errore disegno contenuto navigazione: {e}")
@@ -603,38 +801,27 @@ class MicroNavDisplayController:
             logger.error("Display non inizializzato per mostrare panoramica percorso")
             return
         
-        with self.display_lock:
-            try:
-                
-                origin = route_data.get('origin', '')
-                destination = route_data.get('destination', '')
-                logger.debug(f"Mostrando panoramica: origine='{origin[:50]}...', destinazione='{destination[:50]}...'")
-                
-                # Aggiorna lo stato PRIMA di disegnare per evitare conflitti
-                self.current_route = route_data
-                self.display_state['current_screen'] = 'route_overview'
-                self.display_state['last_update'] = datetime.now()
-                
-                with canvas(self.device) as draw:
-                    self._draw_route_overview_content(draw, route_data)
-                    
-                    # Disegna sempre gli indicatori di connessione (overlay)
-                    status = self.current_connection_status
-                    self._draw_wifi_indicator(draw, status.get('wifi_connected', False))
-                    self._draw_mqtt_indicator(draw, status.get('mqtt_connected', False))
-                    self._draw_gps_indicator(draw, status.get('gps_connected', False), status.get('gps_has_fix', False))
-                
-                # Salva l'immagine corrente per aggiornamenti parziali (DOPO il disegno)
-                # Questo deve essere fatto immediatamente per evitare che update_connections_status
-                # trovi current_display_image = None e ridisegni tutto
-                self._save_current_display()
-                
-                logger.info(f"Panoramica percorso visualizzata: {origin} → {destination}")
-                
-            except Exception as e:
-                logger.error(f"Errore visualizzazione panoramica: {e}")
+        origin = route_data.get('origin', '')
+        destination = route_data.get('destination', '')
+        
+        # Panoramica identica a quella già mostrata: nessun nuovo frame
+        route_key = (origin, destination, route_data.get('totalDistance'), route_data.get('totalDuration'))
+        if route_key == self._last_route_key and self.display_state['current_screen'] == 'route_overview':
+            logger.debug("Panoramica invariata, frame non ridisegnato")
+            return
+        self._last_route_key = route_key
+        
+        logger.debug(f"Mostrando panoramica: origine='{origin[:50]}...', destinazione='{destination[:50]}...'")
+        
+        # Aggiorna lo stato: il disegno avviene nel thread di rendering
+        self.current_route = route_data
+        self.display_state['current_screen'] = 'route_overview'
+        self.display_state['last_update'] = datetime.now()
+        self._request_render()
+        
+        logger.info(f"Panoramica percorso aggiornata: {origin} → {destination}")
     
-    def _draw_route_overview_content(self, draw, route_data: Dict[str, Any] = None, safe_mode: bool = False):
+    def _draw_route_overview_content(self, draw, route_data: Dict[str, Any] = None):
         """Disegna il contenuto della schermata panoramica percorso"""
         try:
             # Usa i dati correnti se non forniti
@@ -651,27 +838,12 @@ class MicroNavDisplayController:
             if not self.fonts_sys['large'] or not self.fonts_sys['medium'] or not self.fonts_sys['small']:
                 self._load_fonts()
             
-            # Sfondo
-            draw.rectangle(
-                (0, 0, self.config['width'], self.config['height']),
-                fill=self.colors['black']
-            )
-            
-            # Titolo
-            draw.text(
-                (10, 15),
-                "Percorso",
-                font=self.fonts_sm['large'],
-                fill=self.colors['white']
-            )
+            # Sfondo, titolo ed etichette "Da:"/"A:" pre-rasterizzati
+            if self._route_chrome is None:
+                self._prebuild_static_assets()
+            draw._image.paste(self._route_chrome, (0, 0))
             
             # Origine
-            draw.text(
-                (10, 45),
-                "Da:",
-                font=self.fonts_sys['medium'],
-                fill=self.colors['light_gray']
-            )
             # Tronca l'origine se troppo lunga
             origin_short = origin[:50] + "..." if len(origin) > 50 else origin
             self._draw_wrapped_text(
@@ -684,12 +856,6 @@ class MicroNavDisplayController:
             )
             
             # Destinazione
-            draw.text(
-                (10, 100),
-                "A:",
-                font=self.fonts_sys['medium'],
-                fill=self.colors['light_gray']
-            )
             # Tronca la destinazione se troppo lunga
             destination_short = destination[:50] + "..." if len(destination) > 50 else destination
             self._draw_wrapped_text(
@@ -703,39 +869,26 @@ class MicroNavDisplayController:
             
             # Distanza totale
             if total_distance > 0:
-                distance_text = f"{total_distance}m"
-                if total_distance >= 1000:
-                    distance_text = f"{total_distance/1000:.1f}km"
+                distance_text = _fmt_distance(total_distance)
                 
                 draw.text(
                     (10, 160),
-                    f"{distance_text}",
+                    distance_text,
                     font=self.fonts_sys['large'],
                     fill=self.colors['white']
                 )
             
             # Durata totale
             if total_duration > 0:
-                duration_text = f"{total_duration}s"
-                if total_duration >= 60:
-                    minutes = total_duration // 60
-                    duration_text = f"{minutes}m"
-                if total_duration >= 3600:
-                    hours = total_duration // 3600
-                    minutes = (total_duration % 3600) // 60
-                    duration_text = f"{hours}h {minutes}m"
+                duration_text = _fmt_duration(total_duration)
                 
                 draw.text(
-                    (self.config['width'] - 10 - draw.textlength(f"{duration_text}", font=self.fonts_sys['large']), 160),
-                    f"{duration_text}",
+                    (self.config['width'] - 10 - self._tw(self.fonts_sys['large'], duration_text), 160),
+                    duration_text,
                     font=self.fonts_sys['large'],
                     fill=self.colors['light_gray']
                 )
             
-            # Salva l'immagine corrente per aggiornamenti parziali (solo se non in modalità safe)
-            if not safe_mode:
-                self._save_current_display()
-            
         except Exception as e:
             logger.error(f"Errore disegno contenuto panoramica: {e}")
 
@@ -745,45 +898,29 @@ class MicroNavDisplayController:
             logger.error("Display non inizializzato per mostrare istruzione")
             return
         
-        with self.display_lock:
-            try:
-                # Pulisci lo schermo prima di mostrare l'istruzione
-                # logger.debug("Pulizia schermo prima di istruzione")
-                # self.clear_display()
-                # time.sleep(0.1)  # Piccola pausa per assicurarsi che la pulizia sia completata
-                
-                logger.debug(f"Inizio visualizzazione istruzione: {instruction_data.get('instruction', '')[:30]}...")
-                
-                # Aggiorna lo stato PRIMA di disegnare per evitare conflitti
-                self.current_instruction = instruction_data
-                self.display_state['current_screen'] = 'navigation'
-                self.display_state['last_update'] = datetime.now()
-                
-                with canvas(self.device) as draw:
-                    self._draw_navigation_content(draw, instruction_data)
-                    
-                    # Disegna overlay speedcam se presente (sempre visibile sopra navigation)
-                    if self.current_speedcam and self.current_speedcam_distance is not None:
-                        self._draw_speedcam_alert_content(draw, self.current_speedcam, self.current_speedcam_distance)
-                    
-                    # Disegna sempre gli indicatori di connessione (overlay)
-                    status = self.current_connection_status
-                    self._draw_wifi_indicator(draw, status.get('wifi_connected', False))
-                    self._draw_mqtt_indicator(draw, status.get('mqtt_connected', False))
-                    self._draw_gps_indicator(draw, status.get('gps_connected', False), status.get('gps_has_fix', False))
-                
-                # Salva l'immagine corrente per aggiornamenti parziali (DOPO il disegno)
-                # Questo deve essere fatto immediatamente per evitare che update_connections_status
-                # trovi current_display_image = None e ridisegni tutto
-                self._save_current_display()
-                
-                logger.info(f"✅ Istruzione visualizzata correttamente: {instruction_data.get('instruction', '')[:30]}...")
-                
-            except Exception as e:
-                logger.error(f"❌ Errore visualizzazione istruzione: {e}")
-                logger.error(f"   Tipo errore: {type(e).__name__}")
-                import traceback
-                logger.error(f"   Traceback: {traceback.format_exc()}")
+        # MQTT ripubblica spesso lo stesso step: se i campi disegnati non cambiano non serve un nuovo frame
+        maneuver = instruction_data.get('maneuver') or {}
+        nav_key = (
+            instruction_data.get('instruction'),
+            instruction_data.get('distance'),
+            instruction_data.get('icon'),
+            maneuver.get('type'),
+            maneuver.get('modifier')
+        )
+        if nav_key == self._last_nav_key and self.display_state['current_screen'] == 'navigation':
+            logger.debug("Istruzione invariata, frame non ridisegnato")
+            return
+        self._last_nav_key = nav_key
+        
+        logger.debug(f"Inizio visualizzazione istruzione: {instruction_data.get('instruction', '')[:30]}...")
+        
+        # Aggiorna lo stato: il disegno avviene nel thread di rendering
+        self.current_instruction = instruction_data
+        self.display_state['current_screen'] = 'navigation'
+        self.display_state['last_update'] = datetime.now()
+        self._request_render()
+        
+        logger.info(f"✅ Istruzione aggiornata: {instruction_data.get('instruction', '')[:30]}...")
     
     def _should_show_speedcam_overlay(self) -> bool:
         """
@@ -826,56 +963,24 @@ class MicroNavDisplayController:
             logger.error("Display non inizializzato per mostrare alert speedcam")
             return
         
-        with self.display_lock:
-            try:
-                logger.debug(f"Inizio visualizzazione alert speedcam overlay - Distanza: {distance:.0f}m")
-                
-                # Salva i dati speedcam per poterli ridisegnare se necessario
-                self.current_speedcam = speedcam_data
-                self.current_speedcam_distance = distance
-                
-                # NON cambiare current_screen - l'alert è un overlay
-                self.display_state['last_update'] = datetime.now()
-                
-                # Verifica se dovremmo mostrare l'overlay
-                if not self._should_show_speedcam_overlay():
-                    logger.debug("Overlay speedcam non mostrato: regole di visualizzazione non soddisfatte")
-                    return
-                
-                # Ridisegna la schermata corrente + overlay alert
-                with canvas(self.device) as draw:
-                    # Prima disegna la schermata corrente
-                    current_screen = self.display_state.get('current_screen', 'idle')
-                    if current_screen == 'idle':
-                        self._draw_idle_content(draw)
-                    elif current_screen == 'navigation':
-                        self._draw_navigation_content(draw, safe_mode=True)
-                    elif current_screen == 'route_overview':
-                        self._draw_route_overview_content(draw, safe_mode=True)
-                    else:
-                        # Default: idle screen
-                        self._draw_idle_content(draw)
-                    
-                    # Poi disegna l'alert sopra (overlay) se permesso
-                    if self._should_show_speedcam_overlay():
-                        self._draw_speedcam_alert_content(draw, speedcam_data, distance)
-                    
-                    # Disegna sempre gli indicatori di connessione (overlay)
-                    status = self.current_connection_status
-                    self._draw_wifi_indicator(draw, status.get('wifi_connected', False))
-                    self._draw_mqtt_indicator(draw, status.get('mqtt_connected', False))
-                    self._draw_gps_indicator(draw, status.get('gps_connected', False), status.get('gps_has_fix', False))
-                
-                # Salva l'immagine corrente per aggiornamenti parziali
-                self._save_current_display()
-                
-                logger.debug(f"✅ Alert speedcam overlay visualizzato correttamente - Distanza: {distance:.0f}m")
-                
-            except Exception as e:
-                logger.error(f"❌ Errore visualizzazione alert speedcam: {e}")
-                logger.error(f"   Tipo errore: {type(e).__name__}")
-                import traceback
-                logger.error(f"   Traceback: {traceback.format_exc()}")
+        logger.debug(f"Inizio visualizzazione alert speedcam overlay - Distanza: {distance:.0f}m")
+        
+        # Salva i dati speedcam per poterli ridisegnare se necessario
+        self.current_speedcam = speedcam_data
+        self.current_speedcam_distance = distance
+        
+        # NON cambiare current_screen - l'alert è un overlay
+        self.display_state['last_update'] = datetime.now()
+        
+        # Verifica se dovremmo mostrare l'overlay
+        if not self._should_show_speedcam_overlay():
+            logger.debug("Overlay speedcam non mostrato: regole di visualizzazione non soddisfatte")
+            return
+        
+        # Il thread di rendering ridisegna la schermata corrente con l'overlay
+        self._request_render()
+        
+        logger.debug(f"✅ Alert speedcam overlay richiesto - Distanza: {distance:.0f}m")
     
     def _draw_speedcam_alert_content(self, draw, speedcam_data: Dict[str, Any], distance: float):
         """
@@ -923,22 +1028,16 @@ class MicroNavDisplayController:
             txt_margin_x = alert_x + 10
             txt_margin_y = 70 + delta_y
             if self.fonts_sys['medium']:
-                bbox = draw.textbbox((0, 0), type_text, font=self.fonts_sys['medium'])
-                type_width = bbox[2] - bbox[0]
-                draw.text((txt_margin_x, txt_margin_y), type_text, font=self.fonts_sys['medium'], fill=self.colors['white'])
+                self._draw_label(draw, (txt_margin_x, txt_margin_y), type_text, self.fonts_sys['medium'], self.colors['white'])
 
             txt_margin_y = 90 + delta_y
             if self.fonts_sys['small']:
-                bbox = draw.textbbox((0, 0), type_status, font=self.fonts_sys['small'])
-                type_status_width = bbox[2] - bbox[0]
-                draw.text((txt_margin_x, txt_margin_y), type_status, font=self.fonts_sys['small'], fill=self.colors['white'])
+                self._draw_label(draw, (txt_margin_x, txt_margin_y), type_status, self.fonts_sys['small'], self.colors['white'])
             
             # Distanza (in grande)
             distance_text = f"{int(distance)}m"
             txt_margin_y = 110 + delta_y
             if self.fonts_sys['large']:
-                bbox = draw.textbbox((0, 0), distance_text, font=self.fonts_sys['large'])
-                distance_width = bbox[2] - bbox[0]
                 draw.text((txt_margin_x, txt_margin_y), distance_text, font=self.fonts_sys['large'], fill=self.colors['white'])
                         
             # Indicatore visivo (cerchio o simbolo)
@@ -957,7 +1056,6 @@ class MicroNavDisplayController:
             if speedcam_type == 'A':
                 # Mostra l'icona del semaforo nel cerchio per speedcam tipo "A"
                 try:
-                    import os
                     # path  e dimensioni icona semaforo traffic light
                     traffic_light_path = self.directions_icons_config['icon_traffic_light']
                     icon_width = 15
@@ -965,13 +1063,10 @@ class MicroNavDisplayController:
                     icon_x = int(indicator_x - icon_width // 2)
                     icon_y = int(indicator_y - icon_height // 2)
                     
-                    if os.path.exists(traffic_light_path):
-                        with Image.open(traffic_light_path) as traffic_light_image:
-                            # Ridimensiona l'immagine a icon_width x icon_height prima di incollarla
-                            resized_icon = traffic_light_image.resize((icon_width, icon_height), Image.LANCZOS)
-                            draw._image.paste(resized_icon, (icon_x, icon_y))
-                    else:
-                        logger.error(f"Icona semaforo non trovata: {traffic_light_path}")
+                    # Decodificata e ridimensionata una sola volta, poi solo incollata
+                    traffic_light = self._load_image(traffic_light_path, (icon_width, icon_height))
+                    if traffic_light is not None:
+                        draw._image.paste(traffic_light, (icon_x, icon_y))
 
                 except Exception as e:
                     logger.error(f"Errore caricamento icona semaforo: {e}")
@@ -980,364 +1075,762 @@ class MicroNavDisplayController:
                 # mostra Vmax testuale nel cerchio per speedcam tipo "G"
                 vmax_text = str(speedcam_vmax)
                 if self.fonts_sys['medium']:
-                    bbox = draw.textbbox((0, 0), vmax_text, font=self.fonts_sys['medium'])
+                    bbox = self._tbbox(self.fonts_sys['medium'], vmax_text)
                     vmax_text_width = bbox[2] - bbox[0]
                     vmax_text_height = bbox[3] - bbox[1]
                     vmax_x = indicator_x - vmax_text_width // 2
                     vmax_y = indicator_y - vmax_text_height
-                    draw.text((vmax_x, vmax_y), vmax_text, font=self.fonts_sys['medium'], fill=self.colors['black'])
+                    self._draw_label(draw, (vmax_x, vmax_y), vmax_text, self.fonts_sys['medium'], self.colors['black'])
             else:
                 vmax_text = "!"
                 if self.fonts_sys['medium']:
-                    bbox = draw.textbbox((0, 0), vmax_text, font=self.fonts_sys['medium'])
+                    bbox = self._tbbox(self.fonts_sys['medium'], vmax_text)
                     vmax_text_width = bbox[2] - bbox[0]
                     vmax_text_height = bbox[3] - bbox[1]
                     vmax_x = indicator_x - vmax_text_width // 2
                     vmax_y = indicator_y - vmax_text_height
-                    draw.text((vmax_x, vmax_y), vmax_text, font=self.fonts_sys['medium'], fill=self.colors['black'])
+                    self._draw_label(draw, (vmax_x, vmax_y), vmax_text, self.fonts_sys['medium'], self.colors['black'])
 
         except Exception as e:
             logger.error(f"Errore disegno alert speedcam: {e}")
     
+    def _tw(self, font, text: str) -> float:
+        """Larghezza del testo in pixel, memorizzata per (font, testo)"""
+        key = (id(font), text)
+        width = self._text_w_cache.get(key)
+        if width is None:
+            # getlength restituisce solo l'avanzamento orizzontale (Pillow >= 9.2)
+            width = font.getlength(text) if hasattr(font, 'getlength') else font.getbbox(text)[2]
+            self._text_w_cache[key] = width
+        return width
+    
+    def _tbbox(self, font, text: str) -> Tuple[int, int, int, int]:
+        """Bounding box del testo disegnato in (0, 0), memorizzato per (font, testo)"""
+        key = (id(font), text)
+        bbox = self._text_bbox_cache.get(key)
+        if bbox is None:
+            bbox = font.getbbox(text)
+            self._text_bbox_cache[key] = bbox
+        return bbox
+    
+    def _draw_label(self, draw, position: Tuple[int, int], text: str, font, fill):
+        """
+        Disegna un'etichetta a insieme finito di valori incollandone la versione pre-rasterizzata
+        
+        Equivale a draw.text(position, text, font=font, fill=fill): FreeType interviene
+        solo la prima volta per ogni combinazione (font, testo, colore).
+        """
+        key = (id(font), text, fill)
+        label = self._label_cache.get(key)
+        if label is None:
+            _, _, right, bottom = self._tbbox(font, text)
+            size = (max(1, right), max(1, bottom))
+            mask = Image.new('L', size, 0)
+            ImageDraw.Draw(mask).text((0, 0), text, font=font, fill=255)
+            label = (Image.new('RGB', size, fill), mask)
+            self._label_cache[key] = label
+        
+        rgb, mask = label
+        draw._image.paste(rgb, (int(position[0]), int(position[1])), mask)
+    
+    def _wrap_to_width(self, text: str, font, max_width: int) -> Tuple[str, int]:
+        """
+        Spezza il testo in righe entro max_width (al massimo 4 più "...")
+        
+        Returns:
+            Tuple[str, int]: righe unite da '\n' e spaziatura per multiline_text,
+            memorizzate per (font, testo, larghezza)
+        """
+        key = (id(font), text, max_width)
+        wrapped = self._wrap_cache.get(key)
+        if wrapped is not None:
+            return wrapped
+        
+        # Limita la lunghezza del testo alle 4 righe disegnabili: caratteri per riga stimati
+        # dalla larghezza disponibile, così il testo scartato non viene nemmeno misurato
+        max_chars = max(1, int(max_width / self._tw(font, 'M')))
+        budget = max_chars * 4
+        if len(text) > budget:
+            text = text[:budget] + "..."
+        
+        words = text.split(' ')
+        lines = []
+        current_line = []
+        
+        # Ogni parola viene misurata una sola volta: la larghezza della riga è una somma progressiva
+        space_w = self._tw(font, ' ')
+        current_w = 0
+        
+        for word in words:
+            word_w = self._tw(font, word)
+            candidate_w = current_w + space_w + word_w if current_line else word_w
+            
+            if candidate_w <= max_width:
+                current_line.append(word)
+                current_w = candidate_w
+            else:
+                if current_line:
+                    lines.append(' '.join(current_line))
+                    current_line = [word]
+                    current_w = word_w
+                else:
+                    # Se una singola parola è troppo lunga, troncala
+                    if len(word) > max_chars:
+                        word = word[:max_chars] + "..."
+                    lines.append(word)
+        
+        if current_line:
+            lines.append(' '.join(current_line))
+        
+        # Limita a 4 righe per evitare overflow verticale
+        if len(lines) > 4:
+            lines = lines[:4] + ["..."]
+        
+        # multiline_text aggiunge la spaziatura all'altezza di riga: passo fisso di 20px come prima
+        spacing = 20 - self._tbbox(font, "A")[3]
+        
+        wrapped = ('\n'.join(lines), spacing)
+        self._wrap_cache[key] = wrapped
+        return wrapped
+    
     def _draw_wrapped_text(self, draw, text: str, position: Tuple[int, int], 
                           max_width: int, font, color):
         """Disegna testo con a capo automatico"""
-        try:
-            x, y = position
-            words = text.split(' ')
-            lines = []
-            current_line = []
-            
-            # Limita la lunghezza del testo per evitare overflow
-            max_chars = 35  # Limite caratteri per riga (ridotto per display piccolo)
-            if len(text) > max_chars * 4:  # Se troppo lungo, tronca (max 2 righe)
-                text = text[:max_chars * 4] + "..."
-                words = text.split(' ')
-            
-            for word in words:
-                test_line = ' '.join(current_line + [word])
-                bbox = draw.textbbox((0, 0), test_line, font=font)
-                text_width = bbox[2] - bbox[0]
-                
-                if text_width <= max_width:
-                    current_line.append(word)
-                else:
-                    if current_line:
-                        lines.append(' '.join(current_line))
-                        current_line = [word]
-                    else:
-                        # Se una singola parola è troppo lunga, troncala
-                        if len(word) > max_chars:
-                            word = word[:max_chars] + "..."
-                        lines.append(word)
-            
-            if current_line:
-                lines.append(' '.join(current_line))
-            
-            # Limita a 2 righe per evitare overflow verticale
-            for i, line in enumerate(lines[:4]):
-                draw.text((x, y), line, font=font, fill=color)
-                y += 20  # Spaziatura tra righe ottimizzata per display piccolo
-            if len(lines) > 4:
-                draw.text((x, y), "...", font=font, fill=color)
-            
-        except Exception as e:
-            logger.error(f"Errore disegno testo: {e}")
-            # Fallback: mostra solo i primi caratteri
-            try:
-                short_text = text[:30] + "..." if len(text) > 30 else text
-                draw.text(position, short_text, font=font, fill=color)
-            except:
-                pass
+        block, spacing = self._wrap_to_width(text, font, max_width)
+        draw.multiline_text(position, block, font=font, fill=color, spacing=spacing)
     
     def _get_icon_path(self, maneuver_data: dict) -> str:
         """
         Costruisce il path dell'icona PNG basato sui dati della manovra.
         Segue la convenzione del README: direction_{type}_{modifier}.png
+        
+        I path risolti sono memorizzati per (icon, type, modifier): l'insieme delle manovre è finito.
         """
         try:
-            # Prova prima a usare il campo 'icon' che arriva già normalizzato dal JavaScript
             icon_name_raw = maneuver_data.get('icon', '')
-            if icon_name_raw and icon_name_raw != 'unknown':
-                # Il campo icon arriva già normalizzato (es. "end_of_road_right")
-                icon_name = f"direction_{icon_name_raw}"
-            else:
-                # Fallback: costruisci il nome dall'oggetto maneuver
-                maneuver = maneuver_data.get('maneuver', {})
-                maneuver_type = maneuver.get('type', '')
-                modifier = maneuver.get('modifier', '')
-                
-                # Normalizza: sostituisci spazi con underscore
-                maneuver_type = maneuver_type.replace(' ', '_') if maneuver_type else ''
-                modifier = modifier.replace(' ', '_') if modifier else ''
-                
-                # Costruisce il nome dell'icona secondo la convenzione
-                if modifier:
-                    icon_name = f"direction_{maneuver_type}_{modifier}"
-                else:
-                    icon_name = f"direction_{maneuver_type}"
-            
-            # Path completo dell'icona PNG
-            icon_path = f"{self.directions_icons_config['path']}/{icon_name}.png"
-            
-            logger.debug(f"Path icona costruito: {icon_path}")
-            logger.debug(f"Dati manovra - icon: '{icon_name_raw}', type: '{maneuver_data.get('maneuver', {}).get('type', '')}', modifier: '{maneuver_data.get('maneuver', {}).get('modifier', '')}'")
+            maneuver = maneuver_data.get('maneuver') or {}
+            key = (icon_name_raw, maneuver.get('type', ''), maneuver.get('modifier', ''))
             
+            icon_path = self._icon_path_cache.get(key)
+            if icon_path is None:
+                icon_path = self._resolve_icon_path(*key)
+                self._icon_path_cache[key] = icon_path
             return icon_path
             
         except Exception as e:
             logger.error(f"Errore costruzione path icona: {e}")
             return f"{self.directions_icons_config['path']}/direction_close.png"  # Icona di fallback
+    
+    def _resolve_icon_path(self, icon_name_raw: str, maneuver_type: str, modifier: str) -> str:
+        """Risolve il path dell'icona per una combinazione (icon, type, modifier) non ancora vista"""
+        # Prova prima a usare il campo 'icon' che arriva già normalizzato dal JavaScript
+        if icon_name_raw and icon_name_raw != 'unknown':
+            # Il campo icon arriva già normalizzato (es. "end_of_road_right")
+            icon_name = f"direction_{icon_name_raw}"
+        else:
+            # Fallback: costruisci il nome dall'oggetto maneuver
+            # Normalizza: sostituisci spazi con underscore
+            maneuver_type = maneuver_type.replace(' ', '_') if maneuver_type else ''
+            modifier = modifier.replace(' ', '_') if modifier else ''
+            
+            # Costruisce il nome dell'icona secondo la convenzione
+            if modifier:
+                icon_name = f"direction_{maneuver_type}_{modifier}"
+            else:
+                icon_name = f"direction_{maneuver_type}"
+        
+        # Path completo dell'icona PNG
+        icon_path = f"{self.directions_icons_config['path']}/{icon_name}.png"
+        
+        logger.debug(f"Path icona costruito: {icon_path}")
+        logger.debug(f"Dati manovra - icon: '{icon_name_raw}', type: '{maneuver_type}', modifier: '{modifier}'")
+        
+        return icon_path
 
-    def _draw_maneuver_icon(self, draw, icon_path: str, icon_x: int, icon_y: int):
-        """Disegna icona manovra PNG"""
+    def _icon_exists(self, icon_path: str) -> bool:
+        """os.path.exists memorizzato: il set di icone non cambia a runtime"""
+        exists = self._icon_exists_cache.get(icon_path)
+        if exists is None:
+            exists = os.path.exists(icon_path)
+            self._icon_exists_cache[icon_path] = exists
+        return exists
+    
+    def _load_image(self, image_path: str, size: Optional[Tuple[int, int]] = None):
+        """
+        Restituisce un'immagine decodificata una sola volta, convertita in RGB ed
+        eventualmente ridimensionata a size. None (memorizzato) se il file manca.
+        """
+        key = (image_path, size)
+        if key in self.icon_cache:
+            return self.icon_cache[key]
+        
+        image = None
+        if self._icon_exists(image_path):
+            try:
+                with Image.open(image_path) as source:
+                    logger.debug(f"Immagine caricata: {image_path} {source.mode} {source.size}")
+                    if size is not None and source.size != size:
+                        source = source.resize(size, self._icon_resample)
+                    image = source.convert('RGB')
+            except Exception as e:
+                logger.error(f"Errore caricamento immagine {image_path}: {e}")
+        else:
+            logger.error(f"Immagine non trovata: {image_path}")
+        
+        self.icon_cache[key] = image
+        return image
+    
+    def _load_icon(self, icon_path: str):
+        """
+        Restituisce l'icona già decodificata, ridimensionata e composta sullo sfondo nero.
+        Il risultato (anche None per icone mancanti) è memorizzato in icon_cache.
+        """
+        if icon_path in self.icon_cache:
+            return self.icon_cache[icon_path]
+        
+        # Icona ancora in decodifica nel pool di preload: attendi quella invece di rifarla
+        future = self._icon_prewarm_futures.get(icon_path)
+        if future is not None:
+            return future.result()
+        
+        return self._decode_icon(icon_path)
+    
+    def _decode_icon(self, icon_path: str):
+        """Decodifica e ridimensiona un'icona PNG, memorizzandola in icon_cache"""
+        icon = None
         try:
-            import os
-            
-            
-            # Verifica se il file esiste
-            if not os.path.exists(icon_path):
-                logger.warning(f"Icona {icon_path} non trovata: {icon_path}")
-                # Disegna icona di fallback
-                self._draw_fallback_icon(draw, icon_x, icon_y)
-                return
-            
-            # Carica l'icona PNG
             with Image.open(icon_path) as nav_icon_image:
                 logger.debug(f"Immagine caricata: {nav_icon_image.mode} {nav_icon_image.size}")
                 
-                # Converte immediatamente in RGBA per gestire palette con trasparenza
-                if nav_icon_image.mode in ('P', 'L', 'LA'):
-                    # Gestisce palette e immagini in scala di grigi con trasparenza
-                    nav_icon_image = nav_icon_image.convert('RGBA')
-                elif nav_icon_image.mode != 'RGBA':
-                    nav_icon_image = nav_icon_image.convert('RGBA')
+                # Converte in RGBA per gestire palette e scala di grigi con trasparenza
+                nav_icon_image = nav_icon_image.convert('RGBA')
                 
-                # Ridimensiona l'icona per il display (24x24 pixel)
+                # Ridimensiona l'icona per il display con il filtro configurato
+                # (saltato se la sorgente ha già la dimensione finale)
                 icon_size = self.directions_icons_config['size']
-                nav_icon_image = nav_icon_image.resize((icon_size, icon_size), Image.Resampling.LANCZOS)
+                if nav_icon_image.size != (icon_size, icon_size):
+                    nav_icon_image = nav_icon_image.resize((icon_size, icon_size), self._icon_resample)
                 
-                # Incolla l'icona sul canvas esistente
-                if nav_icon_image.mode == 'RGBA':
-                    # Usa l'alpha channel come maschera per la trasparenza
-                    mask = nav_icon_image.split()[-1]  # Prende il canale alpha
-                    draw._image.paste(nav_icon_image, (icon_x, icon_y), mask)
-                else:
-                    # Se non ha trasparenza, incolla direttamente
-                    draw._image.paste(nav_icon_image, (icon_x, icon_y))
-                
-                logger.debug(f"Icona PNG integrata nel canvas: {icon_path}")
-
-
-            
+                # Composizione una tantum sullo sfondo (sempre nero nell'area icona):
+                # ad ogni frame basta una copia RGB senza maschera
+                icon = Image.new('RGB', nav_icon_image.size, self.colors['black'])
+                icon.paste(nav_icon_image, (0, 0), nav_icon_image.getchannel('A'))
+        except FileNotFoundError:
+            logger.warning(f"Icona non trovata: {icon_path}")
         except Exception as e:
             logger.error(f"Errore caricamento icona PNG {icon_path}: {e}")
-            # Disegna icona di fallback in caso di errore
+        
+        self.icon_cache[icon_path] = icon
+        return icon
+    
+    def _prewarm_icons(self):
+        """Avvia la decodifica in background di tutte le icone di manovra"""
+        icons_dir = self.directions_icons_config['path']
+        try:
+            icon_paths = [
+                entry.path for entry in os.scandir(icons_dir)
+                if entry.name.endswith('.png') and entry.path not in self.icon_cache
+            ]
+        except OSError as e:
+            logger.warning(f"⚠️ Cartella icone non accessibile {icons_dir}: {e}")
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='icon-preload')
+        self._icon_prewarm_futures = {
+            path: executor.submit(self._decode_icon, path) for path in icon_paths
+        }
+        # I worker terminano da soli a coda esaurita
+        executor.shutdown(wait=False)
+        logger.debug(f"🖼️ Preload di {len(icon_paths)} icone avviato")
+    
+    def _draw_maneuver_icon(self, draw, icon_path: str, icon_x: int, icon_y: int):
+        """Disegna icona manovra PNG"""
+        # Gli errori di decodifica sono già gestiti da _load_icon (restituisce None)
+        icon = self._load_icon(icon_path)
+        if icon is None:
+            # Disegna icona di fallback
             self._draw_fallback_icon(draw, icon_x, icon_y)
+            return
+        
+        # Copia diretta: l'icona è già composta sullo sfondo
+        draw._image.paste(icon, (icon_x, icon_y))
     
     def _draw_fallback_icon(self, draw, icon_x: int, icon_y: int):
         """Disegna icona di fallback geometrica"""
-        try:
-            # Icona generica di fallback
-            draw.rectangle((icon_x-10, icon_y-10, icon_x+10, icon_y+10), outline=self.colors['white'], width=2)
-            draw.text((icon_x-5, icon_y-5), "?", font=self.fonts_sm['small'], fill=self.colors['white'])
-        except Exception as e:
-            logger.error(f"Errore disegno icona fallback: {e}")
+        # Icona generica di fallback, centrata su (icon_x, icon_y)
+        if self._fallback_icon is None:
+            self._prebuild_static_assets()
+        draw._image.paste(self._fallback_icon, (icon_x - 10, icon_y - 10))
 
 
 ### Schermate di stato delle connessioni
 
-    def _draw_wifi_indicator(self, draw, connected: bool):
-
-        # (RI)Carica font se necessario
-        if not self.fonts_sm['small']:
-            self._load_fonts()
-
-        """Disegna indicatore WiFi"""
-        try:
-            x = 10
-            y = 35
-            
-            if connected:
-                # WiFi connesso (verde)
-                draw.ellipse((x, y+5, x+5, y+10), fill=self.colors['green'])
-                # draw.rectangle((x, y, x+32, y+18), outline=self.colors['light_gray'], width=1)
-                draw.text((x+10, y+2), "WiFi", font=self.fonts_sm['small'], fill=self.colors['white'])
-            else:
-                # WiFi disconnesso (rosso)
-                draw.ellipse((x, y+5, x+5, y+10), fill=self.colors['gray'])
-                # draw.rectangle((x, y, x+32, y+18), outline=self.colors['gray'], width=1)
-                draw.text((x+10, y+2), "WiFi", font=self.fonts_sm['small'], fill=self.colors['gray'])
-                
-        except Exception as e:
-            logger.error(f"Errore indicatore WiFi: {e}")
+    def _build_indicator_sprite(self, label: str, dot_color: str, text_color: str):
+        """Rasterizza pallino + etichetta di un indicatore come coppia (RGB, maschera alpha)"""
+        font = self.fonts_sm['small']
+        width = 10 + int(self._tw(font, label)) + 2
+        height = max(11, 2 + self._tbbox(font, label)[3] + 1)
+        
+        sprite = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(sprite)
+        draw.ellipse((0, 5, 5, 10), fill=self.colors[dot_color])
+        draw.text((10, 2), label, font=font, fill=self.colors[text_color])
+        return sprite.convert('RGB'), sprite.getchannel('A')
     
-    def _draw_mqtt_indicator(self, draw, connected: bool):
-
-        # (RI)Carica font se necessario
-        if not self.fonts_sm['small']:
-            self._load_fonts()
-
-        """Disegna indicatore MQTT"""
-        try:
-            x = 65
-            y = 35
-            
-            if connected:
-                # MQTT connesso (verde)
-                draw.ellipse((x, y+5, x+5, y+10), fill=self.colors['green'])
-                # draw.rectangle((x, y, x+32, y+18), outline=self.colors['light_gray'], width=1)
-                draw.text((x+10, y+2), "MQTT", font=self.fonts_sm['small'], fill=self.colors['white'])
-            else:
-                # MQTT disconnesso (rosso)
-                draw.ellipse((x, y+5, x+5, y+10), fill=self.colors['gray'])
-                # draw.rectangle((x, y, x+32, y+18), outline=self.colors['gray'], width=1)
-                draw.text((x+10, y+2), "MQTT", font=self.fonts_sm['small'], fill=self.colors['gray'])
-                
-        except Exception as e:
-            logger.error(f"Errore indicatore MQTT: {e}")
+    def _build_indicator_sprites(self):
+        """Pre-rasterizza gli indicatori di connessione in tutti i loro stati"""
+        self._indicator_sprites = {
+            (kind, state): self._build_indicator_sprite(label, dot_color, text_color)
+            for kind, (label, states) in self._INDICATOR_STATES.items()
+            for state, (dot_color, text_color) in states.items()
+        }
+        # Le barre composte dipendono dagli sprite appena ricostruiti
+        self._status_strip_cache = {}
     
-    def _draw_gps_indicator(self, draw, connected: bool, has_fix: bool):
-
-        # (RI)Carica font se necessario
-        if not self.fonts_sm['small']:
-            self._load_fonts()
-
-        """Disegna indicatore GPS"""
-        try:
-            x = 120
-            y = 35
-            
-            if connected and has_fix:
-                # GPS connesso (verde)
-                draw.ellipse((x, y+5, x+5, y+10), fill=self.colors['green'])
-                # draw.rectangle((x, y, x+32, y+18), outline=self.colors['white'], width=1)
-                draw.text((x+10, y+2), "GPS", font=self.fonts_sm['small'], fill=self.colors['white'])
-            elif connected and not has_fix:
-                # GPS connesso ma no fix (giallo)
-                draw.ellipse((x, y+5, x+5, y+10), fill=self.colors['yellow'])
-                # draw.rectangle((x, y, x+32, y+18), outline=self.colors['white'], width=1)
-                draw.text((x+10, y+2), "GPS", font=self.fonts_sm['small'], fill=self.colors['light_gray'])
-            else:
-                # GPS disconnesso (rosso)
-                draw.ellipse((x, y+5, x+5, y+10), fill=self.colors['gray'])
-                # draw.rectangle((x, y, x+32, y+18), outline=self.colors['gray'], width=1)
-                draw.text((x+10, y+2), "GPS", font=self.fonts_sm['small'], fill=self.colors['gray'])
-                
-        except Exception as e:
-            logger.error(f"Errore indicatore MQTT: {e}")
+    def _status_strip(self, wifi_connected: bool, mqtt_connected: bool, gps_state: str):
+        """Barra di stato composta (RGB, maschera alpha) per una combinazione di stati, memorizzata"""
+        key = (wifi_connected, mqtt_connected, gps_state)
+        strip = self._status_strip_cache.get(key)
+        if strip is not None:
+            return strip
+        
+        if self._indicator_sprites is None:
+            # (RI)Carica font se necessario
+            if not self.fonts_sm['small']:
+                self._load_fonts()
+            self._build_indicator_sprites()
+        
+        x0 = self._INDICATOR_X['wifi']
+        parts = [
+            (self._indicator_sprites[('wifi', wifi_connected)], self._INDICATOR_X['wifi'] - x0),
+            (self._indicator_sprites[('mqtt', mqtt_connected)], self._INDICATOR_X['mqtt'] - x0),
+            (self._indicator_sprites[('gps', gps_state)], self._INDICATOR_X['gps'] - x0),
+        ]
+        width = max(offset + sprite.width for (sprite, _), offset in parts)
+        height = max(sprite.height for (sprite, _), _ in parts)
+        
+        composed = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+        for (sprite, mask), offset in parts:
+            composed.paste(sprite, (offset, 0), mask)
+        
+        strip = (composed.convert('RGB'), composed.getchannel('A'))
+        self._status_strip_cache[key] = strip
+        return strip
+    
+    def _draw_status_strip(self, draw, status: Dict[str, bool]):
+        """Disegna gli indicatori WiFi/MQTT/GPS con un solo paste della barra di stato"""
+        gps_state = self._GPS_STATE[(
+            bool(status.get('gps_connected', False)),
+            bool(status.get('gps_has_fix', False))
+        )]
+        
+        strip, mask = self._status_strip(
+            bool(status.get('wifi_connected', False)),
+            bool(status.get('mqtt_connected', False)),
+            gps_state
+        )
+        draw._image.paste(strip, (self._INDICATOR_X['wifi'], self._INDICATOR_Y), mask)
 
     def update_connections_status(self, wifi_connected: bool, mqtt_connected: bool, gps_connected: bool, gps_has_fix: bool):
         """Aggiorna gli indicatori di connessione come overlay (sempre visibili su tutte le schermate)"""
         if not self.is_initialized:
             return
         
-        with self.display_lock:
-            try:
-                # Salva lo stato corrente delle connessioni (come overlay)
-                self.current_connection_status = {
-                    'wifi_connected': wifi_connected,
-                    'mqtt_connected': mqtt_connected,
-                    'gps_connected': gps_connected,
-                    'gps_has_fix': gps_has_fix
-                }
-                
-                # Ridisegna la schermata corrente con overlay indicatori
-                with canvas(self.device) as draw:
-                    # Prima disegna la schermata corrente
-                    current_screen = self.display_state.get('current_screen', 'idle')
-                    if current_screen == 'idle':
-                        self._draw_idle_content(draw)
-                    elif current_screen == 'navigation':
-                        self._draw_navigation_content(draw, safe_mode=True)
-                    elif current_screen == 'route_overview':
-                        self._draw_route_overview_content(draw, safe_mode=True)
-                    else:
-                        self._draw_idle_content(draw)
-                    
-                    # Disegna overlay speedcam se presente e permesso
-                    if (self.current_speedcam and self.current_speedcam_distance is not None and 
-                        self._should_show_speedcam_overlay()):
-                        self._draw_speedcam_alert_content(draw, self.current_speedcam, self.current_speedcam_distance)
-                    
-                    # Disegna sempre gli indicatori di connessione (overlay)
-                    self._draw_wifi_indicator(draw, wifi_connected)
-                    self._draw_mqtt_indicator(draw, mqtt_connected)
-                    self._draw_gps_indicator(draw, gps_connected, gps_has_fix)
-                
-                # Salva l'immagine corrente
-                self._save_current_display()
-                
-            except Exception as e:
-                logger.error(f"Errore aggiornamento status connessioni: {e}")
-                import traceback
-                logger.error(f"Traceback: {traceback.format_exc()}")
+        # I chiamanti interrogano periodicamente: con stato invariato non serve alcun frame
+        state = (wifi_connected, mqtt_connected, gps_connected, gps_has_fix)
+        if state == self._last_conn_state and self.current_display_image is not None:
+            return
+        self._last_conn_state = state
+        
+        # Salva lo stato corrente delle connessioni (come overlay): il ridisegno avviene nel thread di rendering
+        self.current_connection_status = {
+            'wifi_connected': wifi_connected,
+            'mqtt_connected': mqtt_connected,
+            'gps_connected': gps_connected,
+            'gps_has_fix': gps_has_fix
+        }
+        self._request_render()
+    
+    def update_mqtt_status(self, connected: bool):
+        """Aggiorna solo l'indicatore MQTT mantenendo lo stato delle altre connessioni"""
+        status = self.current_connection_status
+        self.update_connections_status(
+            status.get('wifi_connected', False),
+            connected,
+            status.get('gps_connected', False),
+            status.get('gps_has_fix', False)
+        )
     
 
 
 ### Funzioni di supporto
 
-    def _save_current_display(self):
-        """Salva l'immagine corrente del display nel buffer"""
+    def _update_display_from_buffer(self):
+        """Aggiorna il display fisico con l'immagine dal buffer"""
         try:
-            # Crea un'immagine temporanea per catturare il contenuto corrente
-            temp_image = Image.new('RGB', (self.config['width'], self.config['height']), self.colors['black'])
-            temp_draw = ImageDraw.Draw(temp_image)
-            
-                    # Ridisegna il contenuto corrente basandosi sullo stato
-            # Usa i metodi di disegno in modalità safe per evitare ricorsione
-            if self.display_state['current_screen'] == 'idle':
-                self._draw_idle_content(temp_draw)
-            elif self.display_state['current_screen'] == 'navigation':
-                # Chiama _draw_navigation_content in modalità safe
-                self._draw_navigation_content(temp_draw, safe_mode=True)
-            elif self.display_state['current_screen'] == 'route_overview':
-                # Chiama _draw_route_overview_content in modalità safe
-                self._draw_route_overview_content(temp_draw, safe_mode=True)
-            
-            # Disegna overlay speedcam se presente e permesso (non cambia current_screen)
+            if self.current_display_image is not None:
+                self._flush_framebuffer(self.current_display_image)
+                return True
+        except Exception as e:
+            logger.error(f"Errore aggiornamento display da buffer: {e}")
+        return False
+    
+    def _draw_current_screen(self, draw):
+        """Disegna la schermata corrente a partire dallo stato (schermata, speedcam, connessioni)"""
+        try:
+            current_screen = self.display_state.get('current_screen', 'idle')
+            if current_screen == 'navigation':
+                self._draw_navigation_content(draw)
+            elif current_screen == 'route_overview':
+                self._draw_route_overview_content(draw)
+            else:
+                self._draw_idle_content(draw)
+            
+            # Overlay speedcam se presente e permesso (non cambia current_screen)
             if (self.current_speedcam and self.current_speedcam_distance is not None and 
                 self._should_show_speedcam_overlay()):
-                self._draw_speedcam_alert_content(temp_draw, self.current_speedcam, self.current_speedcam_distance)
+                self._draw_speedcam_alert_content(draw, self.current_speedcam, self.current_speedcam_distance)
             
             # Disegna sempre gli indicatori di connessione (overlay)
-            status = self.current_connection_status
-            self._draw_wifi_indicator(temp_draw, status.get('wifi_connected', False))
-            self._draw_mqtt_indicator(temp_draw, status.get('mqtt_connected', False))
-            self._draw_gps_indicator(temp_draw, status.get('gps_connected', False), status.get('gps_has_fix', False))
+            self._draw_status_strip(draw, self.current_connection_status)
             
-            # Salva l'immagine nel buffer
-            self.current_display_image = temp_image
-            return True
         except Exception as e:
-            logger.error(f"Errore salvataggio display corrente: {e}")
-            return False
+            logger.error(f"❌ Errore disegno schermata {self.display_state.get('current_screen')}: {e}")
+            logger.error(f"   Traceback: {traceback.format_exc()}")
     
-    def _update_display_from_buffer(self):
-        """Aggiorna il display fisico con l'immagine dal buffer"""
-        try:
-            if self.current_display_image is not None:
-                self.device.display(self.current_display_image)
+    @property
+    def current_speedcam(self) -> Optional[Dict[str, Any]]:
+        """Dati della speedcam mostrata come overlay, None se nessuna"""
+        return self._current_speedcam
+    
+    @current_speedcam.setter
+    def current_speedcam(self, speedcam_data: Optional[Dict[str, Any]]):
+        # Il controller speedcam assegna direttamente l'attributo e poi richiama show_*:
+        # con l'overlay cambiato la schermata va ridisegnata anche a dati invariati
+        if speedcam_data is not self._current_speedcam:
+            self._invalidate_screen_keys()
+        self._current_speedcam = speedcam_data
+    
+    def _invalidate_screen_keys(self):
+        """Dimentica l'ultima istruzione/panoramica disegnata: il prossimo show_* ridisegna sempre"""
+        self._last_nav_key = None
+        self._last_route_key = None
+    
+    def _request_render(self):
+        """Segnala un cambio di stato: il thread di rendering ridisegnerà la schermata corrente"""
+        self._state_dirty = True
+        self._schedule_render()
+    
+    @contextmanager
+    def _frame(self, flush: bool = True, background: Optional[str] = 'black'):
+        """
+        Disegna sul back buffer e, in uscita, lo scambia con il front buffer
+        
+        L'invio SPI del nuovo front buffer avviene nel thread di trasmissione, in parallelo
+        al disegno del frame successivo. Con flush=False l'invio resta a carico del chiamante.
+        
+        Args:
+            flush: Richiede l'invio del frame al termine del disegno
+            background: Colore (chiave di COLORS) con cui riempire il buffer, None se il
+                contenuto copre già tutto lo schermo
+        """
+        with self.display_lock:
+            if background is not None:
+                # Riempimento diretto del buffer (memset), più rapido di draw.rectangle
+                self._back_buffer.paste(
+                    self.colors[background],
+                    (0, 0, self.config['width'], self.config['height'])
+                )
+            yield self._draw_back
+            
+            self._back_buffer, self._front_buffer = self._front_buffer, self._back_buffer
+            self._draw_back, self._draw_front = self._draw_front, self._draw_back
+            self.current_display_image = self._front_buffer
+            if flush:
+                # Frame speciale (pulizia, boot, reset): il pannello non mostra più la schermata
+                # corrente, quindi uno show_* con gli stessi dati deve ridisegnarla. Sotto il
+                # lock, dopo lo scambio: un show_* concorrente non può restare marcato come
+                # disegnato sotto il frame speciale
+                self._invalidate_screen_keys()
+        if flush:
+            self._schedule_render()
+    
+    def _flush_framebuffer(self, image: Image.Image) -> bool:
+        """
+        Invia al display solo la regione cambiata rispetto all'ultimo frame trasmesso
+        
+        Args:
+            image: Frame completo in coordinate logiche (prima della rotazione)
+            
+        Returns:
+            bool: True se è stato trasmesso qualcosa, False se il frame era invariato
+        """
+        frame = self._snapshot_frame(image)
+        with self._tx_lock:
+            return self._transmit_frame(frame)
+    
+    def _snapshot_frame(self, image: Image.Image) -> Image.Image:
+        """Converte il frame in coordinate dispositivo in una copia indipendente dal buffer sorgente"""
+        frame = self.device.preprocess(image)
+        if frame is image:
+            # Senza rotazione preprocess restituisce lo stesso oggetto: serve una copia stabile
+            frame = image.copy()
+        return frame
+    
+    def _transmit_frame(self, frame: Image.Image, cancellable: bool = False) -> bool:
+        """
+        Trasmette la parte di frame (coordinate dispositivo) diversa da quella sul pannello
+        
+        Args:
+            frame: Frame da trasmettere
+            cancellable: Interrompe l'invio tra un rettangolo e l'altro se in coda c'è già
+                un frame più recente (solo dal thread di trasmissione)
+            
+        Returns:
+            bool: True se è stato trasmesso qualcosa, False se il frame era invariato
+        """
+        if self._panel_image is None:
+            regions = [(0, 0, frame.width, frame.height)]
+        else:
+            regions = self._dirty_regions(ImageChops.difference(frame, self._panel_image))
+            if not regions:
+                return False
+        
+        # Un solo array per frame: le regioni sono viste su di esso, senza crop né copie
+        frame_arr = np.asarray(frame)
+        for index, (left, top, right, bottom) in enumerate(regions):
+            if cancellable and self._tx_queue.qsize() > 0:
+                # Frame più recente già pronto: il resto di questo è superato. Il pannello
+                # registra solo i rettangoli già scritti, così il diff del frame nuovo
+                # ricomprende quelli mancanti (bbox più grande) e nulla resta indietro
+                if index == 0:
+                    return False
+                panel = self._panel_image.copy()
+                for sent in regions[:index]:
+                    panel.paste(frame.crop(sent), sent)
+                self._panel_image = panel
                 return True
-        except Exception as e:
-            logger.error(f"Errore aggiornamento display da buffer: {e}")
-        return False
+            self._write_region(frame_arr[top:bottom, left:right], (left, top, right, bottom))
+        self._panel_image = frame
+        return True
+    
+    def _dirty_regions(self, diff: Image.Image) -> List[Tuple[int, int, int, int]]:
+        """
+        Rettangoli da ritrasmettere, a partire dall'immagine differenza
+        
+        La differenza viene esaminata a fasce orizzontali: fasce modificate consecutive
+        formano un solo rettangolo, così due zone distanti (es. indicatori in alto e
+        distanza in basso) non trascinano nell'invio tutto lo schermo tra le due.
+        """
+        bbox = diff.getbbox()
+        if bbox is None:
+            return []
+        
+        band_h = self._DIRTY_BAND_HEIGHT
+        regions = []
+        current = None
+        for band_top in range(bbox[1], bbox[3], band_h):
+            band_bottom = min(band_top + band_h, bbox[3])
+            band_bbox = diff.crop((bbox[0], band_top, bbox[2], band_bottom)).getbbox()
+            if band_bbox is None:
+                if current is not None:
+                    regions.append(current)
+                    current = None
+                continue
+            
+            left = bbox[0] + band_bbox[0]
+            right = bbox[0] + band_bbox[2]
+            top = band_top + band_bbox[1]
+            bottom = band_top + band_bbox[3]
+            if current is None:
+                current = (left, top, right, bottom)
+            else:
+                current = (min(current[0], left), current[1], max(current[2], right), bottom)
+        
+        if current is not None:
+            regions.append(current)
+        return regions
+    
+    def _write_region(self, region: np.ndarray, bbox: Tuple[int, int, int, int]):
+        """Scrive un rettangolo di pixel sul controller ST7789 (CASET/RASET + RAMWR)"""
+        left, top, right, bottom = bbox
+        left += self.config.get('h_offset', 0)
+        right += self.config.get('h_offset', 0)
+        top += self.config.get('v_offset', 0)
+        bottom += self.config.get('v_offset', 0)
+        
+        # La finestra di indirizzamento resta valida tra un RAMWR e l'altro:
+        # se coincide con la precedente (es. frame completi) basta il solo RAMWR
+        window = (left, top, right, bottom)
+        if window != self._panel_window:
+            self.device.command(0x2A, left >> 8, left & 0xFF, (right - 1) >> 8, (right - 1) & 0xFF)
+            self.device.command(0x2B, top >> 8, top & 0xFF, (bottom - 1) >> 8, (bottom - 1) & 0xFF)
+            self._panel_window = window
+        self.device.command(0x2C)
+        self._write_pixels(self._pack_rgb565(region))
+    
+    def _pack_rgb565(self, arr: np.ndarray) -> memoryview:
+        """
+        Converte pixel RGB (array altezza x larghezza x 3) in RGB565 big-endian (2 byte/pixel invece di 3)
+        
+        Il risultato è una vista sul buffer preallocato _pixel_buf, valida fino all'invio successivo.
+        """
+        height, width = arr.shape[:2]
+        count = width * height
+        pixels = self._pixel_buf[:count].reshape(height, width)
+        np.copyto(pixels, arr[..., 0] & 0xF8)
+        pixels <<= 8
+        pixels |= (arr[..., 1] & 0xFC).astype(np.uint16) << 3
+        pixels |= arr[..., 2] >> 3
+        return memoryview(self._pixel_bytes[:count * 2])
+    
+    def _write_pixels(self, data: memoryview):
+        """Invia i dati pixel dopo RAMWR, senza copie se spidev supporta writebytes2"""
+        spi_dev = getattr(self.device._serial_interface, '_spi', None)
+        if spi_dev is not None and hasattr(spi_dev, 'writebytes2'):
+            # DC alto = dati; writebytes2 accetta il buffer e lo spezza da sé secondo bufsiz
+            self._gpio.output(self.gpio_config['TFT_DC'], _GPIO_HIGH)
+            spi_dev.writebytes2(data)
+        else:
+            self.device.data(list(data))
+    
+    def _schedule_render(self):
+        """Richiede l'invio del buffer corrente al display senza bloccare il chiamante"""
+        if self.display_thread is None or not self.display_thread.is_alive():
+            # Thread di rendering non attivo: disegno e invio sincroni
+            with self.display_lock:
+                self._compose_if_dirty()
+                self._update_display_from_buffer()
+            return
+        
+        try:
+            self._render_queue.put_nowait(1)
+        except queue.Full:
+            # Un invio è già in coda e userà comunque il buffer più recente
+            pass
+    
+    def _compose_if_dirty(self):
+        """Ridisegna la schermata corrente se lo stato è cambiato dall'ultimo frame"""
+        if not self._state_dirty:
+            return
+        self._state_dirty = False
+        # Ogni schermata copre da sé l'intero buffer (sfondo pre-rasterizzato o riempimento)
+        with self._frame(flush=False, background=None) as draw:
+            self._draw_current_screen(draw)
+    
+    def _tune_render_thread(self):
+        """Fissa il thread corrente sulla CPU di rendering e lo porta a SCHED_FIFO (se permesso)"""
+        cpu = self.config.get('render_cpu')
+        if cpu is not None:
+            try:
+                os.sched_setaffinity(0, {cpu})
+                logger.debug(f"Thread rendering fissato sulla CPU {cpu}")
+            except (AttributeError, OSError) as e:
+                logger.debug(f"Affinità CPU {cpu} non applicata: {e}")
+        
+        priority = self.config.get('render_rt_priority')
+        if priority is not None:
+            try:
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+                logger.debug(f"Thread rendering in SCHED_FIFO (priorità {priority})")
+            except (AttributeError, OSError) as e:
+                # Senza root o CAP_SYS_NICE si resta con lo scheduler normale
+                logger.debug(f"SCHED_FIFO non applicato: {e}")
+    
+    def _render_loop(self):
+        """
+        Loop del thread di rendering, unico proprietario dei buffer di disegno:
+        ridisegna la schermata dallo stato corrente e passa l'ultimo frame alla trasmissione
+        """
+        logger.debug("Thread rendering display avviato")
+        self._tune_render_thread()
+        
+        while self.running:
+            try:
+                self._render_queue.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            
+            if not self.running:
+                break
+            
+            with self.display_lock:
+                # Le richieste arrivate nel frattempo sono già incluse nello stato corrente
+                try:
+                    self._render_queue.get_nowait()
+                except queue.Empty:
+                    pass
+                
+                # Disegno dallo stato più recente: più richieste ravvicinate producono un solo frame
+                self._compose_if_dirty()
+                
+                # Copia del frame sotto lock: i frame speciali (boot, reset) possono riusare subito i buffer
+                image = self.current_display_image
+                frame = self._snapshot_frame(image) if image is not None else None
+            
+            # Invio SPI nel thread di trasmissione, in parallelo al disegno del frame successivo
+            if frame is not None:
+                self._submit_frame(frame)
+        
+        logger.debug("Thread rendering display terminato")
+    
+    def _submit_frame(self, frame: Image.Image):
+        """Accoda un frame per il thread di trasmissione, scartando quello non ancora inviato"""
+        if self.tx_thread is None or not self.tx_thread.is_alive():
+            # Thread di trasmissione non attivo: invio sincrono
+            try:
+                with self._tx_lock:
+                    self._transmit_frame(frame)
+            except Exception as e:
+                logger.error(f"Errore invio frame al display: {e}")
+            return
+        
+        # Il diff è calcolato rispetto al pannello: saltare un frame superato non perde nulla
+        try:
+            self._tx_queue.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            self._tx_queue.put_nowait(frame)
+        except queue.Full:
+            pass
+    
+    def _tx_loop(self):
+        """Loop del thread di trasmissione: invia via SPI i frame preparati dal thread di rendering"""
+        logger.debug("Thread trasmissione display avviato")
+        
+        while self.running:
+            try:
+                frame = self._tx_queue.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            
+            if frame is None or not self.running:
+                break
+            
+            try:
+                with self._tx_lock:
+                    self._transmit_frame(frame, cancellable=True)
+            except Exception as e:
+                logger.error(f"Errore invio frame al display: {e}")
+        
+        logger.debug("Thread trasmissione display terminato")
     
     def set_brightness(self, brightness: int):
         """Imposta luminosità display (0-100)"""
         try:
             if 0 <= brightness <= 100:
-                # Converti in PWM (0-100 -> 0-1)
-                pwm_value = brightness / 100.0
-                
-                # Controlla backlight via GPIO
-                if hasattr(self, 'backlight_pwm'):
-                    self.backlight_pwm.ChangeDutyCycle(brightness)
-                else:
-                    # Crea PWM per backlight
-                    GPIO.setup(self.gpio_config['TFT_BL'], GPIO.OUT)
-                    self.backlight_pwm = GPIO.PWM(self.gpio_config['TFT_BL'], 1000)
-                    self.backlight_pwm.start(brightness)
+                # Controlla backlight via GPIO: il duty cycle è già in percentuale
+                with self._backlight_lock:
+                    if self.backlight_pwm is not None:
+                        with self._tx_lock:
+                            self.backlight_pwm.ChangeDutyCycle(brightness)
+                    else:
+                        # Crea PWM per backlight una sola volta, sul pin già configurato come uscita
+                        self._ensure_gpio_configured()
+                        with self._tx_lock:
+                            self.backlight_pwm = self._gpio.PWM(self.gpio_config['TFT_BL'], 1000)
+                            self.backlight_pwm.start(brightness)
                 
                 self.display_state['brightness'] = brightness
                 logger.debug(f"Luminosità impostata: {brightness}%")
@@ -1355,6 +1848,12 @@ class MicroNavDisplayController:
         
         self.running = True
         
+        # Avvia i thread di trasmissione e di rendering
+        self.tx_thread = threading.Thread(target=self._tx_loop, daemon=True)
+        self.tx_thread.start()
+        self.display_thread = threading.Thread(target=self._render_loop, daemon=True)
+        self.display_thread.start()
+        
         # Mostra schermata idle solo se inizializzazione riuscita
         try:
             self.show_idle_screen()
@@ -1378,21 +1877,20 @@ class MicroNavDisplayController:
     def _ensure_backlight_on(self):
         """Forza il backlight acceso e lo mantiene acceso"""
         try:
-            # Se il PWM è già stato creato, usa quello invece di GPIO diretto
-            if hasattr(self, 'backlight_pwm') and self.backlight_pwm is not None:
-                # Il PWM gestisce già il backlight, non interferire
-                logger.debug("💡 Backlight gestito da PWM")
-                return
-            
-            # Altrimenti, usa GPIO diretto (solo durante inizializzazione)
-            GPIO.setup(self.gpio_config['TFT_BL'], GPIO.OUT)
-            GPIO.output(self.gpio_config['TFT_BL'], GPIO.HIGH)
-            
-            # Verifica che sia effettivamente acceso
-            if GPIO.input(self.gpio_config['TFT_BL']) == GPIO.HIGH:
-                logger.debug("💡 Backlight verificato acceso")
-            else:
-                logger.warning("⚠️ Backlight non risponde correttamente")
+            with self._backlight_lock:
+                # Se il PWM è già stato creato, usa quello invece di GPIO diretto
+                if self.backlight_pwm is not None:
+                    # Il PWM gestisce già il backlight, non interferire
+                    logger.debug("💡 Backlight gestito da PWM")
+                    return
+                
+                # Pin già alto: nessuna scrittura
+                if self._bl_state:
+                    return
+                
+                # Altrimenti, usa GPIO diretto (solo durante inizializzazione)
+                self._write_backlight(True)
+            logger.debug("💡 Backlight acceso")
                 
         except Exception as e:
             logger.error(f"❌ Errore controllo backlight: {e}")
@@ -1400,61 +1898,130 @@ class MicroNavDisplayController:
     def _ensure_backlight_off(self):
         """Forza il backlight spento"""
         try:
-            GPIO.setup(self.gpio_config['TFT_BL'], GPIO.OUT)
-            GPIO.output(self.gpio_config['TFT_BL'], GPIO.LOW)
+            # Pin già configurato come uscita in _ensure_gpio_configured: basta la scrittura
+            self._ensure_gpio_configured()
+            with self._backlight_lock:
+                self._write_backlight(False)
             logger.debug("💡 Backlight spento")
         except Exception as e:
             logger.error(f"❌ Errore spegnimento backlight: {e}")
     
+    def _open_gpio(self):
+        """Restituisce il backend GPIO: lgpio se disponibile (/dev/gpiochip), altrimenti RPi.GPIO"""
+        if isinstance(self._gpio, _LgpioGPIO) and self._gpio.handle is not None:
+            return self._gpio
+        if lgpio is not None:
+            try:
+                handle = lgpio.gpiochip_open(self.config.get('gpio_chip', 0))
+                logger.debug("📌 GPIO gestiti tramite lgpio")
+                return _LgpioGPIO(handle)
+            except Exception as e:
+                logger.warning(f"⚠️ lgpio non disponibile, uso RPi.GPIO: {e}")
+        return GPIO
+    
+    def _ensure_gpio_configured(self, force: bool = False):
+        """Apre il backend GPIO e configura i pin una sola volta (force=True per il recupero)"""
+        if self._gpio_configured and not force:
+            return
+        self._gpio = self._open_gpio()
+        self._gpio.setmode(GPIO.BCM)
+        self._gpio.setwarnings(False)
+        self._setup_display_pins()
+        self._setup_backlight_pin()
+        self._gpio_configured = True
+    
+    def _setup_display_pins(self):
+        """Configura CS/DC/RST del display come uscite"""
+        self._gpio.setup(self.gpio_config['TFT_CS'], _GPIO_OUT)
+        self._gpio.setup(self.gpio_config['TFT_DC'], _GPIO_OUT)
+        self._gpio.setup(self.gpio_config['TFT_RST'], _GPIO_OUT)
+    
+    def _setup_backlight_pin(self):
+        """Configura il pin del backlight come uscita"""
+        self._gpio.setup(self.gpio_config['TFT_BL'], _GPIO_OUT)
+        # Con lgpio il claim porta il pin basso: lo stato memorizzato non è più affidabile
+        self._bl_state = False
+    
+    def _write_backlight(self, on: bool):
+        """Scrive lo stato del pin del backlight"""
+        with self._backlight_lock, self._tx_lock:
+            self._gpio.output(self.gpio_config['TFT_BL'], _GPIO_HIGH if on else _GPIO_LOW)
+            self._bl_state = on
+    
     
     def test_partial_update(self):
-        """Test del sistema di aggiornamento parziale"""
+        """Test del sistema di aggiornamento parziale (non bloccante: i passi sono schedulati con timer)"""
         if not self.is_initialized:
             logger.error("Display non inizializzato per test")
             return False
         
-        try:
-            logger.debug("🧪 Test aggiornamento parziale MQTT...")
-            
-            # Mostra schermata idle
-            self.show_idle_screen()
-            time.sleep(1)
-            
-            # Test aggiornamento MQTT (dovrebbe essere parziale)
-            logger.debug("Test MQTT disconnesso...")
-            self.update_mqtt_status(False)
-            time.sleep(2)
-            
-            logger.debug("Test MQTT connesso...")
-            self.update_mqtt_status(True)
-            time.sleep(2)
-            
+        logger.debug("🧪 Test aggiornamento parziale MQTT...")
+        
+        # (descrizione, azione, attesa prima del passo successivo in secondi)
+        steps = [
+            ("Mostra schermata idle", self.show_idle_screen, 1),
+            ("Test MQTT disconnesso...", lambda: self.update_mqtt_status(False), 2),
+            ("Test MQTT connesso...", lambda: self.update_mqtt_status(True), 2),
+        ]
+        self._run_test_step(steps, 0)
+        return True
+    
+    def _run_test_step(self, steps: List[Tuple[str, Any, float]], index: int):
+        """Esegue un passo del test di aggiornamento parziale e schedula il successivo"""
+        if index >= len(steps):
             logger.info("✅ Test aggiornamento parziale completato")
-            return True
-            
+            return
+        
+        description, action, delay = steps[index]
+        try:
+            logger.debug(description)
+            action()
         except Exception as e:
             logger.error(f"❌ Errore test aggiornamento parziale: {e}")
-            return False
+            return
+        
+        timer = threading.Timer(delay, self._run_test_step, args=(steps, index + 1))
+        timer.daemon = True
+        timer.start()
 
     def stop(self):
         """Ferma il controller display"""
         self.running = False
         
+        # Sveglia e attendi il thread di rendering
+        if self.display_thread is not None and self.display_thread.is_alive():
+            try:
+                self._render_queue.put_nowait(None)
+            except queue.Full:
+                pass
+            self.display_thread.join(timeout=2.0)
+        
+        # Il thread di trasmissione termina dopo il rendering: nessun frame resta a metà
+        if self.tx_thread is not None and self.tx_thread.is_alive():
+            try:
+                self._tx_queue.put_nowait(None)
+            except queue.Full:
+                pass
+            self.tx_thread.join(timeout=2.0)
+        
         if self.is_initialized:
             self.clear_display()
             
             # Spegni backlight
             self._ensure_backlight_off()
-            if hasattr(self, 'backlight_pwm'):
-                try:
-                    self.backlight_pwm.stop()
-                except:
-                    pass
-            
-            # Pulisci GPIO
+            with self._backlight_lock:
+                if self.backlight_pwm is not None:
+                    try:
+                        with self._tx_lock:
+                            self.backlight_pwm.stop()
+                    except:
+                        pass
+            
+            # Pulisci GPIO (con lgpio rilascia anche il gpiochip)
             try:
-                GPIO.cleanup()
+                self._gpio.cleanup()
             except:
                 pass
+            self._gpio_configured = False
         
         logger.info("✅ Display Controller fermato")
\ No newline at end of file
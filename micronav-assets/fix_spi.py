@@ -3,15 +3,21 @@
 Script per diagnosticare e risolvere problemi SPI
 """
 
+import grp
 import os
-import subprocess
 import sys
 
+# Output bufferizzato a blocchi anche su terminale: una scrittura per sezione
+# invece di una per riga (ogni sezione viene svuotata esplicitamente)
+if hasattr(sys.stdout, 'reconfigure'):
+    sys.stdout.reconfigure(line_buffering=False)
+
 print("=" * 60)
 print("🔧 DIAGNOSTICA E FIX SPI")
 print("=" * 60)
 
 # 1. Verifica device SPI
+sys.stdout.flush()
 print("\n1️⃣ Verifica device SPI...")
 spi_devices = ['/dev/spidev0.0', '/dev/spidev0.1']
 found_devices = []
@@ -37,6 +43,7 @@ if not found_devices:
     sys.exit(1)
 
 # 2. Verifica configurazione /boot/config.txt o /boot/firmware/config.txt
+sys.stdout.flush()
 print("\n2️⃣ Verifica configurazione SPI...")
 config_paths = ['/boot/firmware/config.txt', '/boot/config.txt']
 config_file = None
@@ -73,10 +80,18 @@ else:
     print("   💡 Verifica manualmente dove si trova il file di configurazione")
 
 # 3. Verifica gruppo spi
+sys.stdout.flush()
 print("\n3️⃣ Verifica gruppo spi...")
 try:
-    result = subprocess.run(['groups'], capture_output=True, text=True)
-    if 'spi' in result.stdout:
+    # Gruppi del processo letti direttamente, senza avviare 'groups'
+    group_names = set()
+    # getgroups() può non includere il gruppo primario/effettivo, che 'groups' mostra sempre
+    for gid in set(os.getgroups()) | {os.getegid()}:
+        try:
+            group_names.add(grp.getgrgid(gid).gr_name)
+        except KeyError:
+            pass
+    if 'spi' in group_names:
         print("   ✅ Utente nel gruppo spi")
     else:
         print("   ❌ Utente NON nel gruppo spi")
@@ -89,13 +104,16 @@ except Exception as e:
     print(f"   ⚠️  Errore: {e}")
 
 # 4. Verifica moduli SPI
+sys.stdout.flush()
 print("\n4️⃣ Verifica moduli SPI...")
 try:
-    result = subprocess.run(['lsmod'], capture_output=True, text=True)
+    # Stessa sorgente di 'lsmod': prima colonna di /proc/modules
+    with open('/proc/modules', 'r') as f:
+        loaded_modules = {line.split(' ', 1)[0] for line in f}
     spi_modules = ['spi_bcm2835', 'spi_bcm2835aux']
     found = False
     for module in spi_modules:
-        if module in result.stdout:
+        if module in loaded_modules:
             print(f"   ✅ Modulo caricato: {module}")
             found = True
     if not found:
@@ -105,6 +123,7 @@ except Exception as e:
     print(f"   ⚠️  Errore: {e}")
 
 # 5. Test accesso diretto
+sys.stdout.flush()
 print("\n5️⃣ Test accesso diretto a /dev/spidev0.0...")
 if os.path.exists('/dev/spidev0.0'):
     try:
@@ -126,6 +145,7 @@ else:
     sys.exit(1)
 
 # Riepilogo
+sys.stdout.flush()
 print("\n" + "=" * 60)
 print("📊 RIEPILOGO")
 print("=" * 60)
@@ -137,4 +157,4 @@ print("\n💡 Se il display è ancora nero, verifica:")
 print("   - Connessioni hardware (DIN/MOSI, CLK/SCLK)")
 print("   - Pin CS, DC, RST collegati correttamente")
 print("   - Alimentazione display (VCC, GND)")
-
+sys.stdout.flush()
@@ -6,6 +6,7 @@ Gestisce la comunicazione con il modulo GPS L76K Waveshare
 
 import serial
 import time
+import math
 import threading
 import logging
 import re
@@ -18,6 +19,35 @@ from config import get_gps_config
 # Configurazione logging
 logger = logging.getLogger(__name__)
 
+# Costanti e funzioni per Haversine risolte una sola volta (calculate_distance gira in loop
+# sulle speedcam e sui punti del percorso)
+_EARTH_RADIUS_M = 6371000  # Raggio Terra in metri
+_DEG_TO_RAD = math.pi / 180.0
+_sin = math.sin
+_cos = math.cos
+_sqrt = math.sqrt
+_atan2 = math.atan2
+
+# Frase NMEA: '$', comando fino alla prima virgola, corpo, '*' del checksum (una sola scansione)
+_NMEA_SENTENCE_RE = re.compile(r'\$([^,*]*)[^*]*\*')
+
+def _nmea_to_decimal(raw: str, hemisphere: str, degree_digits: int) -> Optional[float]:
+    """
+    Converte una coordinata NMEA (D)DDMM.MMMM in gradi decimali
+    
+    Args:
+        raw: Campo coordinata (DDMM.MMMM per latitudine, DDDMM.MMMM per longitudine)
+        hemisphere: Emisfero (N/S/E/W)
+        degree_digits: Cifre dei gradi (2 per latitudine, 3 per longitudine)
+        
+    Returns:
+        Optional[float]: Gradi decimali (negativi per S/W), None se il campo è vuoto
+    """
+    if not raw or not hemisphere:
+        return None
+    value = float(raw[:degree_digits]) + float(raw[degree_digits:]) / 60.0
+    return -value if hemisphere in ('S', 'W') else value
+
 class GPSStatus(Enum):
     """Stati del GPS"""
     DISCONNECTED = "disconnected"
@@ -27,9 +57,9 @@ class GPSStatus(Enum):
     FIXED = "fixed"
     ERROR = "error"
 
-@dataclass
+@dataclass(slots=True)
 class GPSPosition:
-    """Dati di posizione GPS"""
+    """Dati di posizione GPS (slots: niente __dict__ per istanza, get_position ne crea una per chiamata)"""
     latitude: float = 0.0
     longitude: float = 0.0
     altitude: float = 0.0
@@ -65,8 +95,11 @@ class L76KGPSController:
         # Stato GPS
         self.status = GPSStatus.DISCONNECTED
         self.position = GPSPosition()
-        self.last_update = None
+        # Istante dell'ultimo aggiornamento (time.monotonic_ns), convertito in datetime solo su richiesta
+        self._last_update_ns = None
         self.fix_timeout = get_gps_config().get('fix_timeout', 120)  # secondi per ottenere fix
+        # Pausa tra due burst NMEA: dopo questo silenzio l'epoca del ricevitore è chiusa
+        self.epoch_gap = get_gps_config().get('epoch_gap', 0.1)
         self.start_time = None
         
         # Threading
@@ -77,10 +110,12 @@ class L76KGPSController:
         
         # Callbacks
         self.on_position_update = None
+        # Inizio degli aggiornamenti di posizione non ancora notificati (time.monotonic), None se nessuno
+        self._position_pending_since = None
         self.on_status_change = None
         
-        # Configurazione NMEA (inizializzata dopo i metodi)
-        self.nmea_sentences = {}
+        # Configurazione NMEA: tabella comando -> parser, costruita una sola volta
+        self._init_nmea_sentences()
         
         # Statistiche
         self.stats = {
@@ -195,6 +230,14 @@ class L76KGPSController:
             })
             self.mqtt_client.client.publish(disconnect_topic, disconnect_payload, qos=1, retain=True)
     
+    @property
+    def last_update(self) -> Optional[datetime]:
+        """Data/ora dell'ultimo aggiornamento di posizione, None se non ancora ricevuto"""
+        if self._last_update_ns is None:
+            return None
+        elapsed_us = (time.monotonic_ns() - self._last_update_ns) // 1000
+        return datetime.now() - timedelta(microseconds=elapsed_us)
+    
     def _start_reading_thread(self):
         """Avvia il thread di lettura dati GPS"""
         if self.reading_thread and self.reading_thread.is_alive():
@@ -209,16 +252,48 @@ class L76KGPSController:
         """Loop principale di lettura dati GPS"""
         logger.debug("Inizio lettura dati GPS...")
         
+        # Byte ricevuti ma non ancora terminati da '\n'
+        buffer = bytearray()
+        
         while self.is_running and self.serial_connection and self.serial_connection.is_open:
             try:
-                # Leggi una riga dal GPS
-                line = self.serial_connection.readline().decode('utf-8', errors='ignore').strip()
+                # Con aggiornamenti in sospeso attende al massimo la pausa tra due burst:
+                # se la linea tace per epoch_gap l'epoca è chiusa
+                read_timeout = self.epoch_gap if self._position_pending_since is not None else self.timeout
+                if self.serial_connection.timeout != read_timeout:
+                    self.serial_connection.timeout = read_timeout
                 
-                if line:
-                    logger.debug(f"📡 Dati GPS ricevuti: {line}")
-                    self._process_nmea_sentence(line)
-                else:
-                    logger.debug("⏰ Nessun dato GPS ricevuto")
+                # Legge in un colpo tutto ciò che è già arrivato (readline legge un byte alla volta);
+                # con buffer vuoto read(1) attende fino al timeout
+                chunk = self.serial_connection.read(self.serial_connection.in_waiting or 1)
+                if not chunk:
+                    if self._position_pending_since is not None:
+                        # Fine del burst: una sola notifica per tutte le frasi dell'epoca
+                        self._flush_position_update()
+                    else:
+                        logger.debug("⏰ Nessun dato GPS ricevuto")
+                    continue
+                
+                buffer += chunk
+                newline = buffer.find(b'\n')
+                while newline >= 0:
+                    line = buffer[:newline].decode('utf-8', errors='ignore').strip()
+                    del buffer[:newline + 1]
+                    
+                    if line:
+                        # Formattazione lazy (%s) sul percorso per-frase: la stringa viene
+                        # costruita solo se il livello DEBUG è attivo
+                        logger.debug("📡 Dati GPS ricevuti: %s", line)
+                        self._process_nmea_sentence(line)
+                    newline = buffer.find(b'\n')
+                
+                # Linea che non tace mai (burst contigui): notifica comunque almeno una volta al secondo
+                self._flush_position_update(max_age=1.0)
+                
+                # Dati senza terminatore (rumore sulla linea): non accumularli all'infinito
+                if len(buffer) > 4096:
+                    logger.debug("Buffer seriale GPS senza terminatore, scartato")
+                    buffer.clear()
                     
             except serial.SerialTimeoutException:
                 # Timeout normale, continua
@@ -238,39 +313,31 @@ class L76KGPSController:
             sentence: Frase NMEA da processare
         """
         try:
-            # Inizializza dizionario NMEA se non ancora fatto
-            if not self.nmea_sentences:
-                self._init_nmea_sentences()
-            
             # Verifica checksum (disabilitato temporaneamente per debug)
             # if not self._verify_checksum(sentence):
             #     logger.debug(f"Checksum non valido: {sentence}")
             #     return
             
-            # Estrai tipo di frase
-            if not sentence.startswith('$'):
+            # Estrai tipo di frase: '$' iniziale, comando e presenza del checksum in un solo match
+            match = _NMEA_SENTENCE_RE.match(sentence)
+            if match is None:
                 return
             
-            # Rimuovi $ e estrai comando
-            parts = sentence[1:].split('*')
-            if len(parts) < 2:
-                return
-            
-            command = parts[0].split(',')[0]
+            command = match.group(1)
             
             # Processa frase se supportata
             if command in self.nmea_sentences:
                 self.stats['sentences_received'] += 1
-                logger.debug(f"Processando frase {command}: {sentence}")
+                logger.debug("Processando frase %s: %s", command, sentence)
                 
                 try:
                     self.nmea_sentences[command](sentence)
                     self.stats['valid_sentences'] += 1
-                    logger.debug(f"Frase {command} processata con successo")
+                    logger.debug("Frase %s processata con successo", command)
                 except Exception as e:
                     logger.debug(f"Errore parsing {command}: {e}")
             else:
-                logger.debug(f"Comando {command} non supportato")
+                logger.debug("Comando %s non supportato", command)
             
         except Exception as e:
             logger.debug(f"Errore processamento NMEA: {e}")
@@ -286,28 +353,30 @@ class L76KGPSController:
             bool: True se checksum valido
         """
         try:
-            if '*' not in sentence:
+            data, separator, checksum = sentence.partition('*')
+            if not separator:
                 return False
             
-            data, checksum = sentence.split('*')
+            # XOR sui byte (già interi): niente ord() per carattere
             calculated_checksum = 0
+            for byte in data[1:].encode('ascii', 'ignore'):  # Skip il $
+                calculated_checksum ^= byte
             
-            for char in data[1:]:  # Skip il $
-                calculated_checksum ^= ord(char)
-            
-            return hex(calculated_checksum)[2:].upper().zfill(2) == checksum.upper()
-        except:
+            # Confronto tra interi: niente hex()/upper()/zfill()
+            return calculated_checksum == int(checksum[:2], 16)
+        except ValueError:
             return False
     
     def _parse_gpgga(self, sentence: str):
         """Parsa frase GPGGA/GNGGA (Global Positioning System Fix Data)"""
         try:
-            parts = sentence.split(',')
-            if len(parts) < 15:
+            # Frase completa (15 campi) ma spezzata solo fino all'ultimo campo usato (usati i campi 2-9)
+            if sentence.count(',') < 14:
                 return
+            parts = sentence.split(',', 10)
             
             # Debug: stampa i campi
-            logger.debug(f"GNGGA Parts: {parts}")
+            logger.debug("GNGGA Parts: %s", parts)
             
             # Fix quality (campo 6)
             fix_quality = int(parts[6]) if parts[6] else 0
@@ -326,26 +395,11 @@ class L76KGPSController:
             longitude = 0.0
             
             if parts[2] and parts[3] and parts[4] and parts[5]:
-                # Latitudine: DDMM.MMMM (campo 2)
-                lat_raw = parts[2]
-                lat_dir = parts[3]
-                if lat_raw and lat_dir:
-                    lat_deg = float(lat_raw[:2])
-                    lat_min = float(lat_raw[2:])
-                    latitude = lat_deg + (lat_min / 60.0)
-                    if lat_dir == 'S':
-                        latitude = -latitude
-                
-                # Longitudine: DDDMM.MMMM (campo 4)
-                lon_raw = parts[4]
-                lon_dir = parts[5]
-                if lon_raw and lon_dir:
-                    lon_deg = float(lon_raw[:3])
-                    lon_min = float(lon_raw[3:])
-                    longitude = lon_deg + (lon_min / 60.0)
-                    if lon_dir == 'W':
-                        longitude = -longitude
+                # Latitudine: DDMM.MMMM (campo 2), longitudine: DDDMM.MMMM (campo 4)
+                latitude = _nmea_to_decimal(parts[2], parts[3], 2)
+                longitude = _nmea_to_decimal(parts[4], parts[5], 3)
             
+            status_changed = False
             with self.lock:
                 self.position.latitude = latitude
                 self.position.longitude = longitude
@@ -354,7 +408,7 @@ class L76KGPSController:
                 self.position.hdop = hdop
                 self.position.altitude = altitude
                 self.position.is_valid = fix_quality > 0
-                self.last_update = datetime.now()
+                self._last_update_ns = time.monotonic_ns()
                                 
                 # Aggiorna stato se abbiamo fix
                 if fix_quality > 0:
@@ -362,13 +416,19 @@ class L76KGPSController:
                         self.status = GPSStatus.FIXED
                         self.stats['last_fix_time'] = datetime.now()
                         logger.info(f"🎯 GPS Fix ottenuto! Posizione: {latitude:.6f}, {longitude:.6f}, Satelliti: {satellites}, HDOP: {hdop}")
-                        self._notify_status_change()
+                        status_changed = True
                 else:
                     if self.status == GPSStatus.CONNECTED:
                         self.status = GPSStatus.FIXING
-                        self._notify_status_change()
-                
-                self._notify_position_update()
+                        status_changed = True
+            
+            # Callback fuori dal lock: get_position/get_stats non restano bloccati durante
+            # l'elaborazione (speedcam, percorso, MQTT) e i callback possono richiamarli
+            if status_changed:
+                self._notify_status_change()
+            
+            # GGA apre il burst del ricevitore: la notifica avviene alla pausa tra due burst
+            self._mark_position_updated()
                 
         except Exception as e:
             logger.debug(f"Errore parsing GPGGA: {e}")
@@ -376,9 +436,10 @@ class L76KGPSController:
     def _parse_gprmc(self, sentence: str):
         """Parsa frase GPRMC (Recommended Minimum)"""
         try:
-            parts = sentence.split(',')
-            if len(parts) < 12:
+            # Frase completa (12 campi) ma spezzata solo fino all'ultimo campo usato (usati i campi 2-8)
+            if sentence.count(',') < 11:
                 return
+            parts = sentence.split(',', 9)
             
             # Status
             status = parts[2]  # A = Active, V = Void
@@ -386,25 +447,9 @@ class L76KGPSController:
             if status != 'A':
                 return
             
-            # Latitudine
-            lat_raw = parts[3]
-            lat_dir = parts[4]
-            if lat_raw and lat_dir:
-                lat_deg = float(lat_raw[:2])
-                lat_min = float(lat_raw[2:])
-                latitude = lat_deg + (lat_min / 60.0)
-                if lat_dir == 'S':
-                    latitude = -latitude
-            
-            # Longitudine
-            lon_raw = parts[5]
-            lon_dir = parts[6]
-            if lon_raw and lon_dir:
-                lon_deg = float(lon_raw[:3])
-                lon_min = float(lon_raw[3:])
-                longitude = lon_deg + (lon_min / 60.0)
-                if lon_dir == 'W':
-                    longitude = -longitude
+            # Latitudine e longitudine (None se assenti)
+            latitude = _nmea_to_decimal(parts[3], parts[4], 2)
+            longitude = _nmea_to_decimal(parts[5], parts[6], 3)
             
             # Velocità
             speed = float(parts[7]) if parts[7] else 0.0
@@ -413,16 +458,16 @@ class L76KGPSController:
             course = float(parts[8]) if parts[8] else 0.0
             
             with self.lock:
-                if 'latitude' in locals():
+                if latitude is not None:
                     self.position.latitude = latitude
-                if 'longitude' in locals():
+                if longitude is not None:
                     self.position.longitude = longitude
                 self.position.speed = speed
                 self.position.course = course
                 self.position.is_valid = True
-                self.last_update = datetime.now()
-                
-                self._notify_position_update()
+                self._last_update_ns = time.monotonic_ns()
+            
+            self._mark_position_updated()
                 
         except Exception as e:
             logger.debug(f"Errore parsing GPRMC: {e}")
@@ -430,44 +475,29 @@ class L76KGPSController:
     def _parse_gpgll(self, sentence: str):
         """Parsa frase GPGLL/GNGLL (Geographic Position - Latitude/Longitude)"""
         try:
-            parts = sentence.split(',')
-            if len(parts) < 7:
+            # Frase completa (7 campi) ma spezzata solo fino all'ultimo campo usato (usati i campi 1-6)
+            if sentence.count(',') < 6:
                 return
+            parts = sentence.split(',', 7)
             
             # Status
             status = parts[6]
             if status != 'A':
                 return
             
-            # Latitudine
-            lat_raw = parts[1]
-            lat_dir = parts[2]
-            if lat_raw and lat_dir:
-                lat_deg = float(lat_raw[:2])
-                lat_min = float(lat_raw[2:])
-                latitude = lat_deg + (lat_min / 60.0)
-                if lat_dir == 'S':
-                    latitude = -latitude
-            
-            # Longitudine
-            lon_raw = parts[3]
-            lon_dir = parts[4]
-            if lon_raw and lon_dir:
-                lon_deg = float(lon_raw[:3])
-                lon_min = float(lon_raw[3:])
-                longitude = lon_deg + (lon_min / 60.0)
-                if lon_dir == 'W':
-                    longitude = -longitude
+            # Latitudine e longitudine (None se assenti)
+            latitude = _nmea_to_decimal(parts[1], parts[2], 2)
+            longitude = _nmea_to_decimal(parts[3], parts[4], 3)
             
             with self.lock:
-                if 'latitude' in locals():
+                if latitude is not None:
                     self.position.latitude = latitude
-                if 'longitude' in locals():
+                if longitude is not None:
                     self.position.longitude = longitude
                 self.position.is_valid = True
-                self.last_update = datetime.now()
-                
-                self._notify_position_update()
+                self._last_update_ns = time.monotonic_ns()
+            
+            self._mark_position_updated()
                 
         except Exception as e:
             logger.debug(f"Errore parsing GPGLL: {e}")
@@ -475,22 +505,47 @@ class L76KGPSController:
     def _parse_gpvtg(self, sentence: str):
         """Parsa frase GPVTG (Track Made Good and Ground Speed)"""
         try:
-            parts = sentence.split(',')
-            if len(parts) < 10:
+            # Frase completa (10 campi) ma spezzata solo fino all'ultimo campo usato (usato il campo 7)
+            if sentence.count(',') < 9:
                 return
+            parts = sentence.split(',', 8)
             
             # Velocità in km/h
             speed_kmh = float(parts[7]) if parts[7] else 0.0
             
             with self.lock:
                 self.position.speed = speed_kmh / 3.6  # Converti in m/s
-                self._notify_position_update()
+            
+            self._mark_position_updated()
                 
         except Exception as e:
             logger.debug(f"Errore parsing GPVTG: {e}")
     
+    def _mark_position_updated(self):
+        """Segna la posizione come aggiornata: la notifica avviene a fine epoca"""
+        if self._position_pending_since is None:
+            self._position_pending_since = time.monotonic()
+    
+    def _flush_position_update(self, max_age: float = 0.0):
+        """
+        Notifica la posizione se ci sono aggiornamenti in sospeso da almeno max_age secondi
+        
+        Args:
+            max_age: Età minima dell'aggiornamento in sospeso (0 = notifica subito)
+        """
+        pending_since = self._position_pending_since
+        if pending_since is None or time.monotonic() - pending_since < max_age:
+            return
+        self._position_pending_since = None
+        self._notify_position_update()
+    
     def _notify_position_update(self):
-        """Notifica aggiornamento posizione"""
+        """
+        Notifica aggiornamento posizione (da chiamare senza lock)
+        
+        Il callback gira nel thread di lettura, l'unico che modifica la posizione:
+        durante la chiamata self.position non cambia.
+        """
         if self.on_position_update:
             try:
                 self.on_position_update(self.position)
@@ -693,11 +748,14 @@ def format_coordinates(latitude: float, longitude: float) -> str:
     lat_dir = "N" if latitude >= 0 else "S"
     lon_dir = "E" if longitude >= 0 else "W"
     
-    lat_deg = int(abs(latitude))
-    lat_min = (abs(latitude) - lat_deg) * 60
+    # modf separa parte frazionaria e intera in una sola chiamata
+    lat_frac, lat_deg = math.modf(abs(latitude))
+    lat_deg = int(lat_deg)
+    lat_min = lat_frac * 60
     
-    lon_deg = int(abs(longitude))
-    lon_min = (abs(longitude) - lon_deg) * 60
+    lon_frac, lon_deg = math.modf(abs(longitude))
+    lon_deg = int(lon_deg)
+    lon_min = lon_frac * 60
     
     return f"{lat_deg}°{lat_min:.3f}'{lat_dir} {lon_deg}°{lon_min:.3f}'{lon_dir}"
 
@@ -712,20 +770,16 @@ def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     Returns:
         float: Distanza in metri
     """
-    import math
-    
-    R = 6371000  # Raggio Terra in metri
-    
-    lat1_rad = math.radians(lat1)
-    lat2_rad = math.radians(lat2)
-    delta_lat = math.radians(lat2 - lat1)
-    delta_lon = math.radians(lon2 - lon1)
+    lat1_rad = lat1 * _DEG_TO_RAD
+    lat2_rad = lat2 * _DEG_TO_RAD
+    sin_half_dlat = _sin((lat2_rad - lat1_rad) * 0.5)
+    sin_half_dlon = _sin((lon2 - lon1) * (_DEG_TO_RAD * 0.5))
     
-    a = (math.sin(delta_lat / 2) ** 2 + 
-         math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon / 2) ** 2)
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    a = (sin_half_dlat * sin_half_dlat + 
+         _cos(lat1_rad) * _cos(lat2_rad) * sin_half_dlon * sin_half_dlon)
+    c = 2 * _atan2(_sqrt(a), _sqrt(1 - a))
     
-    return R * c
+    return _EARTH_RADIUS_M * c
 
 # if __name__ == "__main__":
 #     # Test del modulo GPS
@@ -473,11 +473,7 @@ class MicroNavSystem:
                                     
                                     # Aggiorna display con nuovo percorso
                                     if self.display_controller:
-                                        # Pulisci display
-                                        self.display_controller.clear_display()
-                                        time.sleep(0.3)
-                                        
-                                        # Mostra panoramica nuovo percorso
+                                        # Mostra panoramica nuovo percorso (ridisegna l'intero schermo)
                                         self.display_controller.show_route_overview(new_route)
                                         
                                         # Mostra prima istruzione dopo delay
@@ -652,12 +648,7 @@ class MicroNavSystem:
             else:
                 logger.warning("⚠️ Percorso senza timestamp. Ignorato e mantenuta schermata idle.")
                 return
-            # Pulisci il display prima di mostrare il nuovo percorso
-            logger.debug("Pulizia display per nuovo percorso")
-            self.display_controller.clear_display()
-            time.sleep(0.5)
-
-            # Mostra panoramica percorso sul display
+            # Mostra panoramica percorso sul display (ridisegna l'intero schermo, niente pulizia prima)
             logger.debug("Mostrando panoramica percorso")
             self.display_controller.show_route_overview(data)
             
@@ -693,8 +684,6 @@ class MicroNavSystem:
             # Fallback: torna alla schermata idle in caso di errore
             try:
                 logger.warning("Tentativo di tornare alla schermata idle dopo errore")
-                self.display_controller.clear_display()
-                time.sleep(0.3)
                 self.display_controller.show_idle_screen()
             except Exception as fallback_error:
                 logger.error(f"Errore anche nel fallback idle: {fallback_error}")
@@ -705,12 +694,7 @@ class MicroNavSystem:
             instruction = data.get('instruction', '')
             logger.info(f"🧭 Istruzione: {instruction[:50]}...")
             
-            # Pulisci il display prima di mostrare la nuova istruzione
-            logger.debug("Pulizia display per nuova istruzione")
-            self.display_controller.clear_display()
-            time.sleep(0.3)  # Pausa per assicurarsi che la pulizia sia completata
-            
-            # Mostra istruzione sul display
+            # Mostra istruzione sul display (ridisegna l'intero schermo, niente pulizia prima)
             logger.debug("Mostrando istruzione di navigazione")
             self.display_controller.show_navigation_instruction(data)
             
@@ -733,8 +717,6 @@ class MicroNavSystem:
             # Fallback: torna alla schermata idle in caso di errore
             try:
                 logger.warning("Tentativo di tornare alla schermata idle dopo errore istruzione")
-                self.display_controller.clear_display()
-                time.sleep(0.3)
                 self.display_controller.show_idle_screen()
             except Exception as fallback_error:
                 logger.error(f"Errore anche nel fallback idle: {fallback_error}")
@@ -779,7 +761,6 @@ class MicroNavSystem:
                 try:
                     logger.warning("Tentativo di tornare alla schermata idle dopo errore prima istruzione")
                     self.display_controller.clear_display()
-                    time.sleep(0.3)
                     # self.display_controller.show_idle_screen()
                 except Exception as fallback_error:
                     logger.error(f"Errore anche nel fallback idle: {fallback_error}")